@@ -0,0 +1,108 @@
+#
+# shared bracket tables
+#
+# every piecewise linear schedule of the hand-written tax modules (progressive bands, threshold tables, rate / offset
+# tables, allowance tapers) as one table: the value of an amount is
+#
+#   bases[i] + (amount - starts[i]) * rates[i], i = the first bracket whose upper end is not below the amount
+#
+# tables are declared once per module and evaluate single floats (bisect) or arrays (np.searchsorted). bases are summed
+# bracket by bracket like the loops they replace, so results match those loops exactly as long as band widths are whole
+# numbers (the running remainder of a loop is then exact).
+#
+
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Brackets:
+    ends: tuple[float, ...]  # upper end of every bracket but the last, which is open
+    starts: tuple[float, ...]
+    bases: tuple[float, ...]
+    rates: tuple[float, ...]
+    tax_free_below: Optional[float] = 0.0  # amounts that are not positive or below this are worth 0, None: no such rule
+    nonnegative: bool = False  # values below 0 are worth 0
+
+    def __call__(self, amount: float) -> float:
+        if self.tax_free_below is not None and (amount <= 0 or amount < self.tax_free_below):
+            return 0.0
+        bracket = bisect_left(self.ends, amount)
+        value = self.bases[bracket] + (amount - self.starts[bracket]) * self.rates[bracket]
+        return max(value, 0.0) if self.nonnegative else value
+
+    @cached_property
+    def _arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        return np.array(self.ends, dtype=np.float64), np.array(self.starts, dtype=np.float64), np.array(self.bases, dtype=np.float64), np.array(self.rates, dtype=np.float64)
+
+    def many(self, amounts: np.ndarray) -> np.ndarray:
+        # __call__ elementwise
+        amounts = np.asarray(amounts, dtype=np.float64)
+        ends, starts, bases, rates = self._arrays
+        bracket = np.searchsorted(ends, amounts)
+        values = bases[bracket] + (amounts - starts[bracket]) * rates[bracket]
+        if self.nonnegative:
+            values = np.maximum(values, 0.0)
+        if self.tax_free_below is not None:
+            values = np.where((amounts <= 0) | (amounts < self.tax_free_below), 0.0, values)
+        return values
+
+
+def _accumulate(widths: Iterable[float], rates: Iterable[float]) -> tuple[float, ...]:
+    # value at the start of each bracket, the full brackets below added one by one
+    bases = [0.0]
+    for width, rate in zip(widths, rates):
+        bases.append(bases[-1] + width * rate)
+    return tuple(bases)
+
+
+def marginal(bands: Iterable[tuple[Optional[float], float]]) -> Brackets:
+    # (width, rate) bands taxed in turn, the last one open (width None or inf). a closed last band taxes nothing above it.
+    widths, rates = [], []
+    for width, rate in bands:
+        widths.append(float("inf") if width is None else float(width))
+        rates.append(float(rate))
+    if widths[-1] != float("inf"):
+        widths.append(float("inf"))
+        rates.append(0.0)
+
+    starts = [0.0]
+    for width in widths[:-1]:
+        starts.append(starts[-1] + width)
+    ends = starts[1:]
+    return Brackets(tuple(ends), tuple(starts), _accumulate(widths[:-1], rates[:-1]), tuple(rates))
+
+
+def cumulative(limits: Iterable[tuple[float, float]]) -> Brackets:
+    # (upper limit, rate) bands, the last limit inf
+    ends, rates = zip(*((float(limit), float(rate)) for limit, rate in limits))
+    starts = (0.0,) + ends[:-1]
+    return Brackets(ends[:-1], starts, _accumulate((end - start for start, end in zip(starts, ends[:-1])), rates[:-1]), rates)
+
+
+def thresholds(rows: Iterable[tuple[float, float, float]]) -> Brackets:
+    # (threshold, base, rate) rows sorted by threshold: base plus rate on the part above the threshold, nothing below the
+    # first threshold. an amount equal to a threshold stays in the lower row.
+    starts, bases, rates = zip(*((float(threshold), float(base), float(rate)) for threshold, base, rate in rows))
+    return Brackets(starts[1:], starts, bases, rates, tax_free_below=starts[0])
+
+
+def offsets(rows: Iterable[tuple[float, float, float]]) -> Brackets:
+    # (upper limit, rate, offset) rows: amount * rate - offset in the first row whose limit is not below the amount,
+    # never below 0
+    ends, rates, subtracted = zip(*((float(limit), float(rate), float(offset)) for limit, rate, offset in rows))
+    return Brackets(ends[:-1], (0.0,) * len(ends), tuple(-offset for offset in subtracted), rates, nonnegative=True)
+
+
+def flat(rate: float, base: float = 0.0) -> Brackets:
+    return Brackets((), (0.0,), (float(base),), (float(rate),))
+
+
+def taper(value: float, start: float, rate: float) -> Brackets:
+    # value up to start, then withdrawn at rate per unit above start, down to 0
+    return Brackets((float(start),), (0.0, float(start)), (float(value), float(value)), (0.0, -float(rate)), tax_free_below=None, nonnegative=True)
@@ -0,0 +1,184 @@
+#
+# shared fx rates
+#
+# ecb reference rates (units of currency per EUR), loaded once per process on first use instead of a new
+# CurrencyConverter() per call. conversions use the latest rate unless a date or a fixed set of rates is pinned,
+# either with pin() or through the GEO_ARB_FX_DATE environment variable (YYYY-MM-DD).
+#
+# the history is read from a compact binary snapshot that is memory-mapped, so there is no parse step and worker
+# processes share the pages. it is compiled from the ecb csv bundled with currency_converter on first use, or ahead of
+# time with `python geo-arb/_fx.py [path]`. GEO_ARB_FX_SNAPSHOT points at a prebuilt snapshot.
+# when the cache dir can't be written, each process keeps the snapshot it compiled in memory.
+#
+# layout: a magic line, a json header line ({"currencies": [...], "days": n}) space-padded to 8 bytes,
+# int32[n] days since 1970-01-01 (the dates with any rate), padding to 8 bytes, float64[currencies][n] rates (nan: none).
+
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+from contextlib import suppress
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Mapping, Optional, Union
+
+import numpy as np
+from currency_converter import ECB_URL, CurrencyConverter, RateNotFoundError
+from currency_converter import __file__ as _currency_converter_file
+from utils import CACHE_DIR, atomic_write
+
+SOURCE_PATH = Path(_currency_converter_file).parent / Path(ECB_URL).name
+SNAPSHOT_MAGIC = b"geo-arb fx snapshot 1\n"
+
+_pinned_date: Optional[date] = date.fromisoformat(os.environ["GEO_ARB_FX_DATE"]) if os.environ.get("GEO_ARB_FX_DATE") else None
+_pinned_rates: Optional[dict[str, float]] = None
+
+
+def _snapshot_path() -> Path:
+    if os.environ.get("GEO_ARB_FX_SNAPSHOT"):
+        return Path(os.environ["GEO_ARB_FX_SNAPSHOT"])
+    return CACHE_DIR / f"fx_{hashlib.sha1(SOURCE_PATH.read_bytes()).hexdigest()[:16]}.bin"
+
+
+def _snapshot_bytes(source: Path = SOURCE_PATH) -> bytes:
+    converter = CurrencyConverter(str(source))
+    currencies = sorted(converter.currencies - {converter.ref_currency})
+    dates = sorted({day for currency in currencies for day, rate in converter._rates[currency].items() if rate is not None})
+    epoch = date(1970, 1, 1)
+    days = np.array([(day - epoch).days for day in dates], dtype=np.int32)
+    rates = np.array([[np.nan if converter._rates[currency].get(day) is None else float(converter._rates[currency][day]) for day in dates] for currency in currencies], dtype=np.float64)
+
+    header = json.dumps({"currencies": currencies, "days": len(days)}).encode()
+    header += b" " * (-(len(SNAPSHOT_MAGIC) + len(header) + 1) % 8) + b"\n"
+    return SNAPSHOT_MAGIC + header + days.tobytes() + b"\0" * (-days.nbytes % 8) + rates.tobytes()
+
+
+def compile_snapshot(path: Path, source: Path = SOURCE_PATH) -> Path:
+    data = _snapshot_bytes(source)
+    with atomic_write(path) as temporary:
+        temporary.write_bytes(data)
+    return path
+
+
+def _parse_snapshot(buffer) -> tuple[np.ndarray, dict[str, int], np.ndarray]:
+    # days, row of each currency, rates, as views of the snapshot bytes (memory-mapped or in memory)
+    assert buffer[: len(SNAPSHOT_MAGIC)] == SNAPSHOT_MAGIC, "not an fx snapshot"
+    offset = buffer.find(b"\n", len(SNAPSHOT_MAGIC)) + 1
+    header = json.loads(buffer[len(SNAPSHOT_MAGIC) : offset])
+    count, currencies = header["days"], header["currencies"]
+    days = np.frombuffer(buffer, dtype=np.int32, count=count, offset=offset)
+    rates = np.frombuffer(buffer, dtype=np.float64, count=len(currencies) * count, offset=offset + days.nbytes + (-days.nbytes % 8)).reshape(len(currencies), count)
+    return days, {currency: row for row, currency in enumerate(currencies)}, rates
+
+
+@lru_cache(maxsize=None)
+def _snapshot() -> tuple[np.ndarray, dict[str, int], np.ndarray]:
+    path = _snapshot_path()
+    if not path.exists():
+        data = _snapshot_bytes()
+        with suppress(OSError), atomic_write(path) as temporary:
+            temporary.write_bytes(data)
+        if not path.exists():
+            # the cache dir can't be written: keep this process's snapshot in memory
+            return _parse_snapshot(data)
+
+    with path.open("rb") as file:
+        return _parse_snapshot(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _day_number(on: date) -> int:
+    return (on - date(1970, 1, 1)).days
+
+
+@lru_cache(maxsize=None)
+def _last_index(currency: str) -> int:
+    # latest date with a rate, as CurrencyConverter's bounds
+    days, rows, rates = _snapshot()
+    if currency == "EUR":
+        return len(days) - 1
+    return int(np.flatnonzero(~np.isnan(rates[rows[currency]]))[-1])
+
+
+def _last_date(currency: str) -> date:
+    days, _, _ = _snapshot()
+    return date.fromordinal(date(1970, 1, 1).toordinal() + int(days[_last_index(currency)]))
+
+
+def pin(on: Optional[date] = None, rates: Optional[Mapping[str, float]] = None) -> None:
+    # pin all conversions to the ecb rates of one date, or to a fixed snapshot of rates per EUR. pin() unpins.
+    global _pinned_date, _pinned_rates
+    assert on is None or rates is None, "pin either a date or rates"
+    _pinned_date = on
+    _pinned_rates = None if rates is None else {"EUR": 1.0, **{currency.upper(): float(rate) for currency, rate in rates.items()}}
+
+
+def rate(currency: str, on: Optional[date] = None) -> float:
+    # units of currency per EUR
+    currency = currency.upper()
+    if _pinned_rates is not None and on is None:
+        assert currency in _pinned_rates, f"{currency} is not pinned"
+        return _pinned_rates[currency]
+    if currency == "EUR":
+        return 1.0
+
+    days, rows, rates = _snapshot()
+    assert currency in rows, f"{currency} is not a supported currency"
+    on = on or _pinned_date
+    if on is None:
+        return float(rates[rows[currency], _last_index(currency)])
+
+    index = int(np.searchsorted(days, _day_number(on)))
+    if index == len(days) or days[index] != _day_number(on) or np.isnan(rates[rows[currency], index]):
+        raise RateNotFoundError(f"{currency} has no rate for {on}")
+    return float(rates[rows[currency], index])
+
+
+def convert(
+    amount: Union[float, np.ndarray],
+    from_currency: str,
+    to_currency: str,
+    on: Optional[date] = None,
+) -> Union[float, np.ndarray]:
+    # same result as CurrencyConverter().convert(amount, from_currency, to_currency), elementwise for arrays
+    if _pinned_rates is None and on is None and _pinned_date is None:
+        # CurrencyConverter takes the latest date of the source currency for both sides
+        on = _last_date(from_currency.upper())
+    source = rate(from_currency, on)
+    target = rate(to_currency, on)
+    if isinstance(amount, np.ndarray):
+        return amount.astype(np.float64) / source * target
+    return float(amount) / source * target
+
+
+def history(currency: str, start: Optional[date] = None, end: Optional[date] = None) -> tuple[np.ndarray, np.ndarray]:
+    # the ecb dates in [start, end] (datetime64[D]) and the rates of currency on them, units per EUR (nan: none)
+    currency = currency.upper()
+    days, rows, rates = _snapshot()
+    assert currency == "EUR" or currency in rows, f"{currency} is not a supported currency"
+    low = int(np.searchsorted(days, _day_number(start))) if start else 0
+    high = int(np.searchsorted(days, _day_number(end), side="right")) if end else len(days)
+    values = np.ones(high - low) if currency == "EUR" else np.asarray(rates[rows[currency], low:high])
+    return days[low:high].astype("datetime64[D]"), values
+
+
+def convert_history(
+    amounts: np.ndarray,
+    from_currency: str,
+    to_currency: str,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    # convert(amount, from_currency, to_currency, on=day) for every amount and every ecb day in [start, end] on which
+    # both currencies have a rate: the days, and a day × amount matrix
+    dates, source = history(from_currency, start, end)
+    _, target = history(to_currency, start, end)
+    known = ~np.isnan(source) & ~np.isnan(target)
+    amounts = np.asarray(amounts, dtype=np.float64).ravel()
+    return dates[known], amounts[None, :] / source[known, None] * target[known, None]
+
+
+if __name__ == "__main__":
+    print(compile_snapshot(Path(sys.argv[1]) if len(sys.argv) > 1 else _snapshot_path()))
@@ -0,0 +1,92 @@
+#
+# shared pieces of the generated lohnsteuer calculators (_lohnsteuer<year>.py)
+#
+# codegen: https://github.com/jenner/LstGen
+#
+
+
+import decimal
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+
+
+class BigDecimal(decimal.Decimal):
+    """Compatibility class for decimal.Decimal"""
+
+    ROUND_DOWN = decimal.ROUND_DOWN
+    ROUND_UP = decimal.ROUND_UP
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _mk_exp(cls, prec):
+        return cls("0." + "0" * prec)
+
+    def divide(self, other, scale=None, rounding=None):
+        if not scale and not rounding:
+            return BigDecimal(self / other)
+        if type(scale) is not int:
+            raise ValueError("Expected integer value for scale")
+        exp = BigDecimal._mk_exp(scale)
+        return BigDecimal((self / other).quantize(exp, rounding=rounding))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def valueOf(cls, value):  # literals are immutable, convert each one once
+        return cls(value)
+
+    def multiply(self, other):
+        return BigDecimal(self * other)
+
+    def setScale(self, scale, rounding):
+        exp = BigDecimal._mk_exp(scale)
+        return BigDecimal(self.quantize(exp, rounding=rounding))
+
+    def add(self, other):
+        return BigDecimal(self + other)
+
+    def subtract(self, other):
+        return BigDecimal(self - other)
+
+    def longValue(self):
+        return int(self)
+
+    def compareTo(self, other):
+        return BigDecimal(self.compare(other))
+
+
+BigDecimal.ZERO = BigDecimal(0)
+BigDecimal.ONE = BigDecimal(1)
+BigDecimal.TEN = BigDecimal(10)
+
+
+#
+# integer helpers
+#
+# integer ports of a pap mirror BigDecimal rounding on plain python ints or on int64 arrays.
+# literals go through BigDecimal.valueOf(), which keeps their exact binary expansion. every rounding step therefore
+# carries the drift between that expansion and the decimal literal, so ties land on the same cent as the generated class.
+#
+
+
+def literal_error(value) -> float:
+    # drift of the decimal the generated class computes with vs. the literal it spells
+    return float(Fraction(value) - Fraction(repr(float(value))))
+
+
+def where(condition, a, b):
+    if isinstance(condition, np.ndarray):
+        return np.where(condition, a, b)
+    return a if condition else b
+
+
+def round_down(num, den: int, err=0.0):
+    # floor(num / den + err) on integers, err being the drift of the generated class in the same unit
+    quotient, remainder = divmod(num, den)
+    drift = remainder + err * den
+    return quotient + (drift >= den) - (drift < 0)
+
+
+def round_up(num, den: int, err=0.0):
+    return -round_down(-num, den, -err)
@@ -0,0 +1,177 @@
+#
+# piecewise linear functions
+#
+# the closed-form nets (austria, liechtenstein, the united kingdom) are piecewise linear in the gross salary apart from
+# their rounding steps. a Piecewise is built from the _brackets tables, contribution caps and tapers of a module with
+# exact rational arithmetic on the floats the module uses, so every break lands exactly where the tables put it. it then
+# compiles to a Curve: float tables evaluated by np.searchsorted, with the slope (1 - marginal rate) and the inverse
+# in closed form.
+#
+# functions are defined for x >= 0. segment i covers (ends[i - 1], ends[i]], the first from 0, the last end is inf, so
+# jumps (liechtenstein's brackets) fall like in _brackets: an amount on a break belongs to the lower segment.
+#
+
+
+import math
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Union
+
+import _brackets
+import numpy as np
+
+Line = tuple[Fraction, Fraction]  # slope, intercept
+Number = Union[int, float, Fraction]
+
+
+@dataclass(frozen=True)
+class Curve:
+    # values[i] + (x - starts[i]) * slopes[i], i = np.searchsorted(ends, x)
+    ends: np.ndarray
+    starts: np.ndarray
+    values: np.ndarray
+    slopes: np.ndarray
+    peaks: np.ndarray  # highest value up to the end of each segment
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float64)
+        segment = np.searchsorted(self.ends, x)
+        return self.values[segment] + (x - self.starts[segment]) * self.slopes[segment]
+
+    def slope(self, x: np.ndarray) -> np.ndarray:
+        return self.slopes[np.searchsorted(self.ends, np.asarray(x, dtype=np.float64))]
+
+    def inverse(self, y: np.ndarray) -> np.ndarray:
+        # smallest x >= 0 whose value reaches y, inf if none does. segments must not fall, jumps may.
+        assert (self.slopes >= 0).all(), "not invertible"
+        y = np.asarray(y, dtype=np.float64)
+        segment = np.minimum(np.searchsorted(self.peaks, y), len(self.peaks) - 1)
+        starts, values, slopes = self.starts[segment], self.values[segment], self.slopes[segment]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.where(slopes > 0, np.maximum(starts + (y - values) / slopes, starts), starts)
+        return np.where(y > self.peaks[-1], np.inf, x)
+
+
+def _at(line: Line, x: Fraction) -> Fraction:
+    return line[0] * x + line[1]
+
+
+@dataclass(frozen=True)
+class Piecewise:
+    ends: tuple[Union[Fraction, float], ...]  # the last is math.inf
+    lines: tuple[Line, ...]
+
+    @staticmethod
+    def _simplified(ends: list, lines: list[Line]) -> "Piecewise":
+        # merge neighbours on the same line
+        merged_ends, merged_lines = [], []
+        for end, line in zip(ends, lines):
+            if merged_lines and merged_lines[-1] == line:
+                merged_ends[-1] = end
+            else:
+                merged_ends.append(end)
+                merged_lines.append(line)
+        return Piecewise(tuple(merged_ends), tuple(merged_lines))
+
+    def _segments(self):
+        # (start, end, line)
+        start = Fraction(0)
+        for end, line in zip(self.ends, self.lines):
+            yield start, end, line
+            start = end
+
+    def _line(self, x: Union[Fraction, float]) -> Line:
+        # the line of the segment ending at or above x
+        return self.lines[bisect_left(self.ends, x)]
+
+    def __add__(self, other: Union["Piecewise", Number]) -> "Piecewise":
+        if not isinstance(other, Piecewise):
+            return Piecewise(self.ends, tuple((slope, intercept + Fraction(other)) for slope, intercept in self.lines))
+        ends = sorted(set(self.ends) | set(other.ends))
+        lines = [(mine[0] + theirs[0], mine[1] + theirs[1]) for mine, theirs in ((self._line(end), other._line(end)) for end in ends)]
+        return Piecewise._simplified(ends, lines)
+
+    __radd__ = __add__
+
+    def __mul__(self, factor: Number) -> "Piecewise":
+        factor = Fraction(factor)
+        return Piecewise._simplified(list(self.ends), [(slope * factor, intercept * factor) for slope, intercept in self.lines])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, divisor: Number) -> "Piecewise":
+        return self * (1 / Fraction(divisor))
+
+    def __neg__(self) -> "Piecewise":
+        return self * -1
+
+    def __sub__(self, other: Union["Piecewise", Number]) -> "Piecewise":
+        return self + -other
+
+    def __rsub__(self, other: Number) -> "Piecewise":
+        return -self + other
+
+    def maximum(self, floor: Number) -> "Piecewise":
+        # max(self, floor), split where a segment crosses the floor
+        floor = Fraction(floor)
+        constant = (Fraction(0), floor)
+        ends, lines = [], []
+        for start, end, line in self._segments():
+            slope, intercept = line
+            crossing = (floor - intercept) / slope if slope else None
+            if crossing is not None and start < crossing < end:
+                ends += [crossing, end]
+                lines += [constant, line] if slope > 0 else [line, constant]
+            else:
+                inside = (start + end) / 2 if end != math.inf else start + 1
+                ends.append(end)
+                lines.append(line if _at(line, inside) >= floor else constant)
+        return Piecewise._simplified(ends, lines)
+
+    def minimum(self, ceiling: Number) -> "Piecewise":
+        return -((-self).maximum(-Fraction(ceiling)))
+
+    def of(self, inner: "Piecewise") -> "Piecewise":
+        # self(inner(x)) for a nondecreasing, continuous inner
+        finite = [end for end in self.ends if end != math.inf]
+        ends, lines = [], []
+        for start, end, (slope, intercept) in inner._segments():
+            assert slope >= 0, "inner function must not fall"
+            if slope == 0:
+                pieces = [(end, bisect_left(finite, intercept))]
+            else:
+                assert start > 0 or intercept not in finite, "inner function starts on a break"
+                cuts = [(bound - intercept) / slope for bound in finite]
+                points = [cut for cut in cuts if start < cut < end] + [end]
+                pieces = [(point, bisect_left(finite, _at((slope, intercept), point)) if point != math.inf else bisect_right(finite, _at((slope, intercept), previous))) for previous, point in zip([start] + points, points)]
+            for point, index in pieces:
+                outer_slope, outer_intercept = self.lines[index]
+                ends.append(point)
+                lines.append((outer_slope * slope, outer_slope * intercept + outer_intercept))
+        return Piecewise._simplified(ends, lines)
+
+    def curve(self) -> Curve:
+        starts = [Fraction(0)] + list(self.ends[:-1])
+        rights = [_at(line, end) if end != math.inf else (math.inf if line[0] > 0 else _at(line, start)) for start, end, line in self._segments()]
+        return Curve(
+            ends=np.array([float(end) for end in self.ends[:-1]], dtype=np.float64),
+            starts=np.array([float(start) for start in starts], dtype=np.float64),
+            values=np.array([float(_at(line, start)) for start, line in zip(starts, self.lines)], dtype=np.float64),
+            slopes=np.array([float(slope) for slope, _ in self.lines], dtype=np.float64),
+            peaks=np.maximum.accumulate(np.array([float(right) for right in rights], dtype=np.float64)),
+        )
+
+
+def identity() -> Piecewise:
+    return Piecewise((math.inf,), ((Fraction(1), Fraction(0)),))
+
+
+def from_brackets(table: _brackets.Brackets) -> Piecewise:
+    # the table on x >= 0
+    first = bisect_right(table.ends, 0.0)
+    lines = [(Fraction(rate), Fraction(base) - Fraction(start) * Fraction(rate)) for start, base, rate in zip(table.starts[first:], table.bases[first:], table.rates[first:])]
+    # tax_free_below only matters at 0 itself here: the first segment must already be worth 0 there
+    assert table.tax_free_below is None or (table.tax_free_below <= 0 and lines[0][1] == 0), "unsupported table"
+    function = Piecewise._simplified([Fraction(end) for end in table.ends[first:]] + [math.inf], lines)
+    return function.maximum(0) if table.nonnegative else function
@@ -27,6 +27,25 @@ ANNUAL_EXPENSES = sum(EXPENSES_BREAKDOWN.values()) * 12
 #
 
 
+from functools import lru_cache
+
+import _brackets
+import _piecewise
+import numpy as np
+from utils import python_round
+
+# progressive tax brackets, einkommensteuertarif, EStG § 33: (monthly upper limit, rate)
+MONTHLY_TAX_BRACKETS = (
+    (1037.33, 0.00),
+    (1620.67, 0.20),
+    (2704.00, 0.30),
+    (5173.33, 0.40),
+    (7760.00, 0.48),
+    (float("inf"), 0.50),
+)
+_MONTHLY_TAX = _brackets.cumulative(MONTHLY_TAX_BRACKETS)
+
+
 def _net_special(gross_special_payments: int) -> float:
     gross = float(gross_special_payments)
 
@@ -46,30 +65,11 @@ def _net_special(gross_special_payments: int) -> float:
 
 
 def _tax_monthly(taxable_income: float) -> float:
-    tax_brackets = [
-        (1037.33, 0.00),
-        (1620.67, 0.20),
-        (2704.00, 0.30),
-        (5173.33, 0.40),
-        (7760.00, 0.48),
-        (float("inf"), 0.50),
-    ]
-
-    if taxable_income <= tax_brackets[0][0]:
+    if taxable_income <= MONTHLY_TAX_BRACKETS[0][0]:
         return 0.00
 
-    income_tax = 0.00
-    previous_limit = 0.00
-
     # progressive tax brackets, einkommensteuertarif, EStG § 33
-    for limit, rate in tax_brackets:
-        if taxable_income > previous_limit:
-            taxable_in_bracket = min(taxable_income, limit) - previous_limit
-            income_tax += taxable_in_bracket * rate
-            previous_limit = limit
-
-            if taxable_income <= limit:
-                break
+    income_tax = _MONTHLY_TAX(taxable_income)
 
     # estimated tax deductibles, arbeitnehmerabsetzbetrag/berkehrsabsetzbetrag, EStG § 33
     income_tax = max(0.00, income_tax - 104.63)
@@ -105,3 +105,109 @@ def net_salary(annual_gross_salary: int) -> int:
     net_special = _net_special(int(gross_special_payments))
 
     return int(12 * net_monthly + net_special)
+
+
+#
+# vectorized
+#
+# the functions above over numpy arrays, with the same rounding steps in the same order: python_round for round(..., 2),
+# np.trunc for int(), and the brackets through the same table as _tax_monthly.
+#
+
+
+def _net_special_many(gross: np.ndarray) -> np.ndarray:
+    social_insurance = python_round(np.minimum(gross, 12900.00) * 0.1707, 2)
+    taxed_amount = np.maximum(0.00, gross - social_insurance - 620.00 * 2)
+    income_tax = python_round(taxed_amount * 0.06, 2)
+    return python_round(gross - social_insurance - income_tax, 2)
+
+
+def _tax_monthly_many(taxable_income: np.ndarray) -> np.ndarray:
+    income_tax = python_round(np.maximum(0.00, _MONTHLY_TAX.many(taxable_income) - 104.63), 2)
+    return np.where(taxable_income <= MONTHLY_TAX_BRACKETS[0][0], 0.00, income_tax)
+
+
+def _net_running_many(gross: np.ndarray) -> np.ndarray:
+    social_insurance = python_round(np.minimum(gross, 6090.00) * 0.1812, 2)
+    income_tax = _tax_monthly_many(gross - social_insurance)
+    return python_round(gross - social_insurance - income_tax, 2)
+
+
+def _per_euro(function, gross: np.ndarray) -> np.ndarray:
+    # function of whole-euro payments, evaluated once per euro amount in their range when that is shorter than gross
+    amounts = gross.astype(np.int64)
+    if amounts.size == 0 or int(amounts.max()) - int(amounts.min()) >= amounts.size:
+        return function(gross)
+    low = int(amounts.min())
+    return function(np.arange(low, int(amounts.max()) + 1, dtype=np.float64))[amounts - low]
+
+
+def net_salary_many(annual_gross_salaries: np.ndarray) -> np.ndarray:
+    # net_salary elementwise, as int64
+    annual_gross_salaries = np.asarray(annual_gross_salaries, dtype=np.float64)
+    gross_monthly_running = annual_gross_salaries / 14
+    net_monthly = _per_euro(_net_running_many, np.trunc(gross_monthly_running))
+    net_special = _per_euro(_net_special_many, np.trunc(2 * gross_monthly_running))
+    return np.where(annual_gross_salaries <= 0, 0, np.trunc(12 * net_monthly + net_special)).astype(np.int64)
+
+
+def optimize_bonus_split(annual_gross_salaries: np.ndarray, steps: int = 51) -> dict:
+    # the same total paid as 12 running payments and k monthly salaries of special payments, for `steps` values of k from
+    # 0 to 2. the sechstel rate only covers special payments up to a sixth of the running ones, so k = 2 (net_salary) is
+    # the most that can be moved. returns the k grid, the net over it (salary × steps), and per salary the special
+    # payments with the highest net (the fewest on ties), that net and net_salary.
+    assert steps >= 2, "invalid split grid"
+    special_months = np.linspace(0.0, 2.0, steps)
+    annual_gross_salaries = np.ravel(np.asarray(annual_gross_salaries, dtype=np.float64))
+
+    gross_monthly_running = annual_gross_salaries[:, None] / (12 + special_months)
+    net_monthly = _per_euro(_net_running_many, np.trunc(gross_monthly_running))
+    net_special = _per_euro(_net_special_many, np.trunc(special_months * gross_monthly_running))
+    net = np.where(annual_gross_salaries[:, None] <= 0, 0, np.trunc(12 * net_monthly + net_special)).astype(np.int64)
+
+    best = np.argmax(net, axis=1)
+    rows = np.arange(len(annual_gross_salaries))
+    return {
+        "special_months": special_months,
+        "net_salary": net,
+        "optimal_special": np.trunc(special_months[best] * gross_monthly_running[rows, best]),
+        "optimal_net": net[rows, best],
+        "default_net": net[:, -1],
+    }
+
+
+#
+# piecewise linear
+#
+# net_salary without its rounding steps is piecewise linear in the annual gross. net_curve() holds it exactly, with
+# breaks at the tax brackets, the social insurance caps (6090 running, 12900 special, ASVG §108) and the tax-free
+# part of the special payments, so inverting it and its marginal rates need no search.
+#
+
+
+@lru_cache(maxsize=None)
+def net_curve() -> _piecewise.Curve:
+    # _net_running and _net_special, on a gross of annual / 14 and 2 * annual / 14
+    annual = _piecewise.identity()
+
+    gross = annual / 14
+    social_insurance = gross.minimum(6090.00) * 0.1812
+    income_tax = (_piecewise.from_brackets(_MONTHLY_TAX).of(gross - social_insurance) - 104.63).maximum(0.00)
+    net_running = gross - social_insurance - income_tax
+
+    gross_special = annual / 7
+    social_insurance_special = gross_special.minimum(12900.00) * 0.1707
+    income_tax_special = (gross_special - social_insurance_special - 620.00 * 2).maximum(0.00) * 0.06
+    net_special = gross_special - social_insurance_special - income_tax_special
+
+    return (net_running * 12 + net_special).curve()
+
+
+def gross_for_net(net_annual_salaries: np.ndarray) -> np.ndarray:
+    # the smallest annual gross whose net before rounding reaches each net, elementwise
+    return net_curve().inverse(net_annual_salaries)
+
+
+def marginal_rate(annual_gross_salaries: np.ndarray) -> np.ndarray:
+    # share of the next euro of annual gross lost to tax and social insurance, elementwise
+    return 1 - net_curve().slope(annual_gross_salaries)
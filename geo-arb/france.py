@@ -26,16 +26,198 @@ ANNUAL_EXPENSES = sum(EXPENSES_BREAKDOWN.values()) * 12
 #
 
 
+import hashlib
+import linecache
+import os
+import pickle
+import sys
+from contextlib import suppress
 from datetime import date
 from functools import lru_cache
-from typing import Optional, Union
-
+from importlib import metadata
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import numpy as np
+from openfisca_core.parameters import Parameter, ParameterNode, ParameterScale
+from openfisca_core.periods import ETERNITY, MONTH
+from openfisca_core.simulations import SimulationBuilder
 from openfisca_france import CountryTaxBenefitSystem
+from openfisca_france.france_taxbenefitsystem import COUNTRY_DIR
+from utils import CACHE_DIR, atomic_write
+
+DEFAULT_OUTPUTS = ("salaire_net", "impot_revenu_restant_a_payer", "cotisations_employeur", "rfr", "nbptr", "ir_brut")
+
+# salary-only workloads can use a reduced system instead: only the variables (and their source files) that DEFAULT_OUTPUTS
+# reach in PRUNED_YEARS, and parameters without documentation or values from more than a decade before those years.
+# set GEO_ARB_FRANCE_PRUNED=1, or PRUNED = True (False overrides the variable). both are read on every evaluation, and
+# each system is built once per process.
+PRUNED: Optional[bool] = None
+PRUNED_YEARS = range(2015, date.today().year + 2)
+# layout of the pickled (variables, files, parameters) snapshot, bump on any change to it or to how it is traced
+PRUNED_FORMAT = 1
+
+
+def _versions() -> str:
+    return f"core-{metadata.version('openfisca-core')}_france-{metadata.version('openfisca-france')}"
+
+
+# loading the yaml parameter tree is most of the cost of CountryTaxBenefitSystem(), so the preprocessed tree is pickled
+# to the cache dir, keyed by the openfisca versions. variables are still loaded from source: their formulas live in
+# per-instance modules that can't be unpickled in another process.
+def _parameters_cache_path() -> Path:
+    return CACHE_DIR / f"france-parameters_{_versions()}.pickle"
+
+
+def _pruned_cache_path() -> Path:
+    # the traced closure depends on the outputs it was traced for
+    outputs = hashlib.sha1(",".join(DEFAULT_OUTPUTS).encode()).hexdigest()[:8]
+    return CACHE_DIR / f"france-pruned-v{PRUNED_FORMAT}_{_versions()}_{PRUNED_YEARS.start}-{PRUNED_YEARS.stop - 1}_{outputs}.pickle"
+
+
+def _load_snapshot(path: Path):
+    try:
+        with path.open("rb") as file:
+            return pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+
+def _store_snapshot(path: Path, snapshot) -> None:
+    # write to a temporary file and rename, so concurrent processes never read a partial snapshot
+    with suppress(OSError), atomic_write(path) as temporary:
+        with temporary.open("wb") as file:
+            pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class _CachedTaxBenefitSystem(CountryTaxBenefitSystem):
+    # openfisca-core looks up package metadata and variable source paths through the module of the class
+    __module__ = CountryTaxBenefitSystem.__module__
+
+    def load_parameters(self, path_to_yaml_dir) -> None:
+        path = _parameters_cache_path()
+        parameters = _load_snapshot(path)
+        if parameters is not None:
+            self.parameters = parameters
+            return
+
+        super().load_parameters(path_to_yaml_dir)
+        _store_snapshot(path, self.parameters)
+
+
+class _PrunedTaxBenefitSystem(CountryTaxBenefitSystem):
+    __module__ = CountryTaxBenefitSystem.__module__
+
+    def __init__(self, variables: frozenset[str], files: frozenset[str], parameters: ParameterNode):
+        self._variables = variables
+        self._files = files
+        self._parameters = parameters
+        super().__init__()
+        # openfisca-core keeps the source of every variable file around for introspection
+        for path in [path for path in linecache.cache if os.path.relpath(path, COUNTRY_DIR) in files]:
+            del linecache.cache[path]
+
+    def load_parameters(self, path_to_yaml_dir) -> None:
+        self.parameters = self._parameters
+
+    def add_variables_from_file(self, file_path) -> None:
+        if os.path.relpath(file_path, COUNTRY_DIR) in self._files:
+            super().add_variables_from_file(file_path)
+
+    def add_variable(self, variable):
+        if variable.__name__ in self._variables:
+            return super().add_variable(variable)
+
+
+def _trim_parameters(node, cutoff: str) -> None:
+    # keep only what evaluation at instants from cutoff on reads: values lists are newest first, so everything after
+    # the first value at or before cutoff is dropped
+    node.description = None
+    node.documentation = None
+    if isinstance(node, Parameter):
+        node.metadata = {}
+        for index, value in enumerate(node.values_list):
+            value.metadata = {}
+            value.file_path = None
+            if value.instant_str <= cutoff:
+                del node.values_list[index + 1 :]
+                break
+        return
+
+    # node and scale metadata stay: openfisca reads a scale's type from it, and the cotisations their order
+    children = node.brackets if isinstance(node, ParameterScale) else node.children.values()
+    for child in children:
+        _trim_parameters(child, cutoff)
+
+
+def _pruned_snapshot() -> tuple[frozenset[str], frozenset[str], ParameterNode]:
+    path = _pruned_cache_path()
+    snapshot = _load_snapshot(path)
+    if snapshot is not None:
+        return snapshot
+
+    # openfisca formulas are vectorized, so which variables a simulation reaches depends on the period and on the
+    # household layout, not on the salaries. a traced probe with our layout for every year gives the closure.
+    system = _CachedTaxBenefitSystem()
+    variables = {"date_naissance", "salaire_de_base", "traitements_salaires_pensions_rentes"}
+    for year in PRUNED_YEARS:
+        salaries = np.array([1.0, 50_000.0, 1_000_000.0])
+        simulation = SimulationBuilder().build_default_simulation(system, count=len(salaries))
+        simulation.set_input("salaire_de_base", str(year), salaries)
+        simulation.set_input("traitements_salaires_pensions_rentes", str(year), salaries * 0.9)
+        simulation.trace = True
+        for variable in DEFAULT_OUTPUTS:
+            _calculate(simulation, variable, str(year))
+        variables.update(node.name for node in simulation.tracer.browse_trace())
+
+    files = {os.path.relpath(sys.modules[system.variables[name].__module__].__file__, COUNTRY_DIR) for name in variables}
+    _trim_parameters(system.parameters, f"{PRUNED_YEARS.start - 10}-01-01")
+    snapshot = (frozenset(variables), frozenset(files), system.parameters)
+    _store_snapshot(path, snapshot)
+    return snapshot
+
+
+def _pruned() -> bool:
+    if PRUNED is not None:
+        return PRUNED
+    return os.environ.get("GEO_ARB_FRANCE_PRUNED", "") not in ("", "0")
 
 
 @lru_cache(maxsize=None)
+def _system(pruned: bool) -> CountryTaxBenefitSystem:
+    if pruned:
+        return _PrunedTaxBenefitSystem(*_pruned_snapshot())
+    return _CachedTaxBenefitSystem()
+
+
 def _tax_benefit_system() -> CountryTaxBenefitSystem:
-    return CountryTaxBenefitSystem()
+    return _system(_pruned())
+
+
+def _check_outputs(outputs: Sequence[str]) -> None:
+    # the pruned system only holds what DEFAULT_OUTPUTS reach, anything else would fail deep inside openfisca
+    if _pruned():
+        variables = _tax_benefit_system().variables
+        for variable in outputs:
+            assert variable in variables, f"{variable} is not in the pruned system (only what DEFAULT_OUTPUTS reach): add it to DEFAULT_OUTPUTS or disable pruning (PRUNED = False, GEO_ARB_FRANCE_PRUNED=0)"
+
+
+def _calculate(simulation, variable: str, period: str) -> np.ndarray:
+    # monthly variables are summed over the year
+    if simulation.tax_benefit_system.variables[variable].definition_period == MONTH:
+        return simulation.calculate_add(variable, period)
+    return simulation.calculate(variable, period)
+
+
+@lru_cache(maxsize=None)
+def _professional_expense_parameters(year: int) -> tuple[float, float, float]:
+    # rate, minimum and maximum of the 10% professional expense deduction
+    parameters = _tax_benefit_system().parameters.impot_revenu.calcul_revenus_imposables.deductions.abatpro
+    instant = f"{year}-01-01"
+    rate = float(parameters.taux.get_at_instant(instant))
+    minimum = float(parameters.min.get_at_instant(instant))
+    maximum = float(parameters.max.get_at_instant(instant))
+    return rate, minimum, maximum
 
 
 def _professional_expense_deduction(
@@ -46,68 +228,108 @@ def _professional_expense_deduction(
     if annual_gross_salary <= 0:
         return 0.0
 
-    parameters = _tax_benefit_system().parameters.impot_revenu.calcul_revenus_imposables.deductions.abatpro
-    instant = f"{year}-01-01"
-    rate = float(parameters.taux.get_at_instant(instant))
-    minimum = float(parameters.min.get_at_instant(instant))
-    maximum = float(parameters.max.get_at_instant(instant))
-
+    rate, minimum, maximum = _professional_expense_parameters(year)
     deduction = annual_gross_salary * rate
     deduction = max(deduction, minimum)
     deduction = min(deduction, maximum)
     return min(deduction, annual_gross_salary)
 
 
-def _build_simulation(
-    annual_gross_salary: float,
+def _professional_expense_deductions(
+    annual_gross_salaries: np.ndarray,
+    year: int,
+) -> np.ndarray:
+    # same as _professional_expense_deduction, elementwise
+    rate, minimum, maximum = _professional_expense_parameters(year)
+    deductions = np.minimum(np.maximum(annual_gross_salaries * rate, minimum), maximum)
+    deductions = np.minimum(deductions, annual_gross_salaries)
+    return np.where(annual_gross_salaries > 0, deductions, 0.0)
+
+
+def _build_simulation_many(
+    annual_gross_salaries: np.ndarray,
     year: int,
     birth_year: Optional[int] = None,
 ):
+    # one independent individu / foyer / menage / famille per salary, each person holding the first role
+    # (declarant_principal, personne_de_reference, demandeur) of its own entities, all in a single simulation
     assert year > 0
     birth_year = birth_year or year - 30
-    scenario_data = {
-        "period": str(year),
-        "individus": {
-            "individu": {
-                "date_naissance": f"{birth_year}-01-01",
-                "salaire_de_base": float(annual_gross_salary),
-            }
-        },
-        "foyers_fiscaux": {
-            "foyer": {
-                "declarants": ["individu"],
-                "personnes_a_charge": [],
-            }
-        },
-        "menages": {
-            "menage": {
-                "personne_de_reference": "individu",
-                "enfants": [],
-            }
-        },
-        "familles": {
-            "famille": {
-                "parents": ["individu"],
-                "enfants": [],
-            }
-        },
-    }
-
     system = _tax_benefit_system()
-    scenario = system.new_scenario().init_from_dict(scenario_data)
-    simulation = scenario.new_simulation()
+    simulation = SimulationBuilder().build_default_simulation(system, count=len(annual_gross_salaries))
+    simulation.set_input("date_naissance", ETERNITY, np.full(len(annual_gross_salaries), np.datetime64(f"{birth_year}-01-01")))
+    _set_salaries(simulation, annual_gross_salaries, year)
+    return simulation
 
-    professional_deduction = _professional_expense_deduction(annual_gross_salary, year)
-    net_taxable_income = float(annual_gross_salary - professional_deduction)
-    simulation.set_input("traitements_salaires_pensions_rentes", str(year), [net_taxable_income])
 
-    return simulation
+def _set_salaries(simulation, annual_gross_salaries: np.ndarray, year: int) -> None:
+    simulation.set_input("salaire_de_base", str(year), annual_gross_salaries)
 
+    professional_deductions = _professional_expense_deductions(annual_gross_salaries, year)
+    net_taxable_incomes = annual_gross_salaries - professional_deductions
+    simulation.set_input("traitements_salaires_pensions_rentes", str(year), net_taxable_incomes)
 
-def _read_variable(simulation, variable: str, period: str, *, add: bool = False) -> float:
-    calculator = simulation.calculate_add if add else simulation.calculate
-    values = calculator(variable, period)
-    return float(values[0]) if getattr(values, "size", 0) else 0.0
+
+def evaluate(
+    annual_gross_salary: Union[int, float, np.ndarray],
+    *,
+    year: int = 2025,
+    birth_year: Optional[int] = None,
+    outputs: tuple[str, ...] = DEFAULT_OUTPUTS,
+) -> dict[str, Union[float, np.ndarray]]:
+    # every requested openfisca variable for the year, from a single simulation.
+    # values are as openfisca reports them (charges are negative), monthly variables are summed over the year.
+    # a scalar salary gives floats, an array of salaries gives arrays of the same shape.
+    assert isinstance(year, int)
+    assert not _pruned() or year in PRUNED_YEARS, "year outside PRUNED_YEARS"
+    _check_outputs(outputs)
+    salaries = np.asarray(annual_gross_salary, dtype=np.float64)
+    period = str(year)
+    simulation = _build_simulation_many(salaries.ravel(), year, birth_year)
+
+    results = {}
+    for variable in outputs:
+        values = _calculate(simulation, variable, period).astype(np.float64)
+        results[variable] = float(values[0]) if salaries.ndim == 0 else values.reshape(salaries.shape)
+    return results
+
+
+def sweep(
+    annual_gross_salaries: np.ndarray,
+    years: Sequence[int],
+    *,
+    birth_year: Optional[int] = None,
+    outputs: tuple[str, ...] = DEFAULT_OUTPUTS,
+) -> dict[str, np.ndarray]:
+    # evaluate over a salary × year grid, as a tidy table: one row per (year, salary), year-major, with "year" and
+    # "annual_gross_salary" columns next to one column per output.
+    # a fixed birth_year makes every year a period of one simulation over the same households, which shares everything
+    # that doesn't depend on the period. without one, people are 30 in each year as in evaluate, so each year needs
+    # its own simulation.
+    salaries = np.asarray(annual_gross_salaries, dtype=np.float64).ravel()
+    years = [int(year) for year in years]
+    assert not _pruned() or all(year in PRUNED_YEARS for year in years), "year outside PRUNED_YEARS"
+    _check_outputs(outputs)
+
+    columns = {variable: [] for variable in outputs}
+    if birth_year is not None and years:
+        simulation = _build_simulation_many(salaries, years[0], birth_year)
+        for year in years[1:]:
+            _set_salaries(simulation, salaries, year)
+        for year in years:
+            for variable in outputs:
+                columns[variable].append(_calculate(simulation, variable, str(year)).astype(np.float64))
+    else:
+        for year in years:
+            values = evaluate(salaries, year=year, outputs=outputs)
+            for variable in outputs:
+                columns[variable].append(values[variable])
+
+    return {
+        "year": np.repeat(np.array(years, dtype=np.int64), len(salaries)),
+        "annual_gross_salary": np.tile(salaries, len(years)),
+        **{variable: np.concatenate(values) if values else np.zeros(0) for variable, values in columns.items()},
+    }
 
 
 def employer_social_contributions(
@@ -122,9 +344,7 @@ def employer_social_contributions(
     salary = float(annual_gross_salary)
     assert salary > 0.0
     assert isinstance(year, int)
-    period = str(year)
-    simulation = _build_simulation(salary, year, birth_year)
-    amount = -_read_variable(simulation, "cotisations_employeur", period, add=True)
+    amount = -evaluate(salary, year=year, birth_year=birth_year, outputs=("cotisations_employeur",))["cotisations_employeur"]
     return int(amount)
 
 
@@ -141,14 +361,7 @@ def employer_total_cost(
     salary = float(annual_gross_salary)
     assert salary > 0.0
     assert isinstance(year, int)
-    period = str(year)
-    simulation = _build_simulation(salary, year, birth_year)
-    contributions = -_read_variable(
-        simulation,
-        "cotisations_employeur",
-        period,
-        add=True,
-    )
+    contributions = -evaluate(salary, year=year, birth_year=birth_year, outputs=("cotisations_employeur",))["cotisations_employeur"]
     return int(salary + contributions)
 
 
@@ -158,28 +371,21 @@ def compute_income_tax(
     year: int,
     birth_year: Optional[int] = None,
 ) -> dict[str, float]:
-    simulation = _build_simulation(float(annual_gross_salary), year, birth_year)
-    period = str(year)
+    values = evaluate(float(annual_gross_salary), year=year, birth_year=birth_year, outputs=("rfr", "nbptr", "ir_brut", "impot_revenu_restant_a_payer", "salaire_net"))
 
     deduction = _professional_expense_deduction(float(annual_gross_salary), year)
     net_taxable_income = float(annual_gross_salary) - deduction
 
-    reference_tax_income = _read_variable(simulation, "rfr", period)
-    shares = _read_variable(simulation, "nbptr", period)
-    gross_tax = _read_variable(simulation, "ir_brut", period)
-    tax_due = -_read_variable(simulation, "impot_revenu_restant_a_payer", period)
-    net_salary_before_tax = _read_variable(simulation, "salaire_net", period, add=True)
-
     return {
         "gross_income": float(annual_gross_salary),
         "professional_expense_deduction": deduction,
         "net_taxable_income": net_taxable_income,
-        "reference_tax_income": reference_tax_income,
-        "shares": shares,
+        "reference_tax_income": values["rfr"],
+        "shares": values["nbptr"],
         "dependents": 0,
-        "gross_tax": gross_tax,
-        "tax_due": tax_due,
-        "net_salary_before_tax": net_salary_before_tax,
+        "gross_tax": values["ir_brut"],
+        "tax_due": -values["impot_revenu_restant_a_payer"],
+        "net_salary_before_tax": values["salaire_net"],
     }
 
 
@@ -197,9 +403,30 @@ def net_salary(
     salary = float(annual_gross_salary)
     assert salary > 0.0
     assert isinstance(year, int)
-    period = str(year)
-    simulation = _build_simulation(salary, year, birth_year)
-    annual_net = _read_variable(simulation, "salaire_net", period, add=True)
-    income_tax = -_read_variable(simulation, "impot_revenu_restant_a_payer", period)
+    values = evaluate(salary, year=year, birth_year=birth_year, outputs=("salaire_net", "impot_revenu_restant_a_payer"))
+    annual_net = values["salaire_net"]
+    income_tax = -values["impot_revenu_restant_a_payer"]
 
     return int(annual_net - income_tax)
+
+
+def net_salary_many(
+    annual_gross_salaries: np.ndarray,
+    *,
+    year: int = 2025,
+    birth_year: Optional[int] = None,
+) -> np.ndarray:
+    # same result as net_salary for every element, from a single simulation with one household per salary
+    salaries = np.asarray(annual_gross_salaries, dtype=np.float64)
+    assert isinstance(year, int)
+    result = np.zeros(salaries.shape, dtype=np.int64)
+    positive = salaries > 0
+    if not positive.any():
+        return result
+
+    values = evaluate(salaries[positive], year=year, birth_year=birth_year, outputs=("salaire_net", "impot_revenu_restant_a_payer"))
+    annual_net = values["salaire_net"]
+    income_tax = -values["impot_revenu_restant_a_payer"]
+
+    result[positive] = np.trunc(annual_net - income_tax).astype(np.int64)
+    return result
@@ -29,38 +29,61 @@ ANNUAL_EXPENSES = sum(EXPENSES_BREAKDOWN.values()) * 12
 #
 
 
-from currency_converter import CurrencyConverter
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+
+import _brackets
+import _fx
+import _piecewise
+import numpy as np
+from utils import python_round
+
+# national income tax, Art. 19 SteG: (low, high, rate, offset), tax = income * rate - offset in the first bracket
+# whose high is not below the income
+NATIONAL_TAX_BRACKETS = (
+    (0, 15855, 0.00, 0),
+    (15856, 21140, 0.01, 159),
+    (21141, 42280, 0.03, 581),
+    (42281, 73990, 0.04, 1004),
+    (73991, 105700, 0.05, 1744),
+    (105701, 137410, 0.06, 2801),
+    (137411, 169120, 0.065, 3488),
+    (169121, 211400, 0.07, 4334),
+    (211401, float("inf"), 0.08, 6448),
+)
+_NATIONAL_TAX = _brackets.offsets((high, rate, offset) for _, high, rate, offset in NATIONAL_TAX_BRACKETS)
+
+# municipal surcharge on the national tax, Art. 76 SteG, set yearly by each municipality between 150% and 250%.
+# placeholder: every commune is set to the 150% minimum, not to its published rate, so sweep_communes returns equal
+# rows until the real rates are filled in here
+COMMUNE_SURCHARGES = {
+    "Balzers": 1.50,
+    "Eschen": 1.50,
+    "Gamprin": 1.50,
+    "Mauren": 1.50,
+    "Planken": 1.50,
+    "Ruggell": 1.50,
+    "Schaan": 1.50,
+    "Schellenberg": 1.50,
+    "Triesen": 1.50,
+    "Triesenberg": 1.50,
+    "Vaduz": 1.50,
+}
 
 
 def _national_tax(income: float) -> float:
-    brackets = [
-        (0, 15855, 0.00, 0),
-        (15856, 21140, 0.01, 159),
-        (21141, 42280, 0.03, 581),
-        (42281, 73990, 0.04, 1004),
-        (73991, 105700, 0.05, 1744),
-        (105701, 137410, 0.06, 2801),
-        (137411, 169120, 0.065, 3488),
-        (169121, 211400, 0.07, 4334),
-        (211401, float("inf"), 0.08, 6448),
-    ]
-    for low, high, rate, offset in brackets:
-        if income <= high:
-            tax = income * rate - offset
-            return max(tax, 0)
-    return 0.0
+    return _NATIONAL_TAX(income)
 
 
-def net_salary(
-    gross_annual_salary: float,
-    input_currency: str = "EUR",
-    output_currency: str = "EUR",
-) -> float:
-    # not reliable, not much data available
-    # based on: https://www.gesetze.li/konso/2010340000 (Art. 19 SteG)
-    converter = CurrencyConverter()
-    if input_currency.upper() == "EUR":
-        gross_annual_salary = converter.convert(gross_annual_salary, "EUR", "CHF")
+def _national_tax_many(income: np.ndarray) -> np.ndarray:
+    # _national_tax elementwise
+    return _NATIONAL_TAX.many(income)
+
+
+def _net_local(gross_annual_salary: float, commune: str = "Vaduz") -> float:
+    # unrounded net in CHF
+    assert commune in COMMUNE_SURCHARGES, "unknown commune"
 
     # social insurance (employee share)
     ahv_iv = gross_annual_salary * 0.047  # 4.025 + 0.675
@@ -73,12 +96,123 @@ def net_salary(
     # taxable income after personal allowance
     taxable_income = max(0, gross_annual_salary - 15855)
 
-    # national + Vaduz municipal (150% surcharge)
+    # national + municipal surcharge
     national_tax = _national_tax(taxable_income)
-    total_income_tax = national_tax * 2.5
+    total_income_tax = national_tax * (1 + COMMUNE_SURCHARGES[commune])
+
+    return gross_annual_salary - social_security - health_insurance - total_income_tax
 
-    net = gross_annual_salary - social_security - health_insurance - total_income_tax
+
+def net_salary(
+    gross_annual_salary: float,
+    input_currency: str = "EUR",
+    output_currency: str = "EUR",
+    commune: str = "Vaduz",
+) -> float:
+    # not reliable, not much data available
+    # based on: https://www.gesetze.li/konso/2010340000 (Art. 19 SteG)
+    if input_currency.upper() == "EUR":
+        gross_annual_salary = _fx.convert(gross_annual_salary, "EUR", "CHF")
+
+    net = _net_local(gross_annual_salary, commune)
 
     if output_currency.upper() == "EUR":
-        return int(converter.convert(net, "CHF", "EUR"))
+        return int(_fx.convert(net, "CHF", "EUR"))
     return round(net, 2)
+
+
+def _net_local_many(gross_annual_salary: np.ndarray, surcharge: np.ndarray) -> np.ndarray:
+    # _net_local elementwise, communes given as their surcharge
+    ahv_iv = gross_annual_salary * 0.047
+    alv = np.minimum(gross_annual_salary, 126000) * 0.005
+    social_security = ahv_iv + alv
+    taxable_income = np.maximum(0, gross_annual_salary - 15855)
+    total_income_tax = _national_tax_many(taxable_income) * (1 + surcharge)
+    return gross_annual_salary - social_security - 1920.0 - total_income_tax
+
+
+def _to_output(net: np.ndarray, output_currency: str) -> np.ndarray:
+    if output_currency.upper() == "EUR":
+        return np.trunc(_fx.convert(net, "CHF", "EUR")).astype(np.int64)
+    return python_round(net, 2)
+
+
+def net_salary_many(
+    gross_annual_salaries: np.ndarray,
+    input_currency: str = "EUR",
+    output_currency: str = "EUR",
+    commune: str | np.ndarray = "Vaduz",
+) -> np.ndarray:
+    # net_salary elementwise: int64 in EUR, CHF rounded to cents. commune is a name or an array of names that
+    # broadcasts against the salaries
+    gross_annual_salaries = np.asarray(gross_annual_salaries, dtype=np.float64)
+    if input_currency.upper() == "EUR":
+        gross_annual_salaries = _fx.convert(gross_annual_salaries, "EUR", "CHF")
+    assert all(name in COMMUNE_SURCHARGES for name in np.unique(commune).tolist()), "unknown commune"
+    surcharge = np.vectorize(COMMUNE_SURCHARGES.__getitem__, otypes=[np.float64])(commune)
+    return _to_output(_net_local_many(gross_annual_salaries, surcharge), output_currency)
+
+
+def sweep_communes(
+    gross_annual_salaries: np.ndarray,
+    input_currency: str = "EUR",
+    output_currency: str = "EUR",
+) -> tuple[tuple[str, ...], np.ndarray]:
+    # net_salary for every municipality: the names, and a commune × salary matrix
+    # in one pass: the national tax is computed once per salary and scaled by the surcharge of each commune
+    gross_annual_salaries = np.ravel(np.asarray(gross_annual_salaries, dtype=np.float64))
+    if input_currency.upper() == "EUR":
+        gross_annual_salaries = _fx.convert(gross_annual_salaries, "EUR", "CHF")
+    communes = tuple(COMMUNE_SURCHARGES)
+    surcharge = np.array([COMMUNE_SURCHARGES[name] for name in communes])[:, None]
+    return communes, _to_output(_net_local_many(gross_annual_salaries[None, :], surcharge), output_currency)
+
+
+@lru_cache(maxsize=None)
+def net_curve(commune: str = "Vaduz") -> _piecewise.Curve:
+    # _net_local exactly as a piecewise linear function of the CHF gross: breaks where the national tax starts, at the
+    # brackets (the net jumps by a few CHF between the whole-franc brackets) and at the ALV cap of 126000
+    assert commune in COMMUNE_SURCHARGES, "unknown commune"
+    gross = _piecewise.identity()
+    social_security = gross * 0.047 + gross.minimum(126000) * 0.005
+    taxable_income = (gross - 15855).maximum(0)
+    total_income_tax = _piecewise.from_brackets(_NATIONAL_TAX).of(taxable_income) * (1 + COMMUNE_SURCHARGES[commune])
+    return (gross - social_security - 1920.0 - total_income_tax).curve()
+
+
+def gross_for_net(
+    net_annual_salaries: np.ndarray,
+    input_currency: str = "EUR",
+    output_currency: str = "EUR",
+    commune: str = "Vaduz",
+) -> np.ndarray:
+    # the smallest gross (in input_currency) whose net before rounding reaches each net (in output_currency), elementwise
+    net_annual_salaries = np.asarray(net_annual_salaries, dtype=np.float64)
+    if output_currency.upper() == "EUR":
+        net_annual_salaries = _fx.convert(net_annual_salaries, "EUR", "CHF")
+    gross = net_curve(commune).inverse(net_annual_salaries)
+    if input_currency.upper() == "EUR":
+        return _fx.convert(gross, "CHF", "EUR")
+    return gross
+
+
+def marginal_rate(gross_annual_salaries: np.ndarray, input_currency: str = "EUR", commune: str = "Vaduz") -> np.ndarray:
+    # share of the next unit of gross lost to social security and income tax, elementwise
+    gross_annual_salaries = np.asarray(gross_annual_salaries, dtype=np.float64)
+    if input_currency.upper() == "EUR":
+        gross_annual_salaries = _fx.convert(gross_annual_salaries, "EUR", "CHF")
+    return 1 - net_curve(commune).slope(gross_annual_salaries)
+
+
+def net_salary_history(
+    gross_annual_salaries: np.ndarray,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    commune: str = "Vaduz",
+) -> tuple[np.ndarray, np.ndarray]:
+    # CHF offers in EUR over time: the ecb dates in [start, end] and a date × salary matrix of
+    # net_salary(gross, input_currency="CHF") at the rates of each date. the CHF net is computed once per salary.
+    assert commune in COMMUNE_SURCHARGES, "unknown commune"
+    nets = _net_local_many(np.ravel(np.asarray(gross_annual_salaries, dtype=np.float64)), COMMUNE_SURCHARGES[commune])
+    dates, converted = _fx.convert_history(nets, "CHF", "EUR", start, end)
+    return dates, np.trunc(converted).astype(np.int64)
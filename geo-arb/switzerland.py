@@ -29,14 +29,20 @@ ANNUAL_EXPENSES = sum(EXPENSES_BREAKDOWN.values()) * 12
 
 
 import csv
+import hashlib
 import math
 from collections import defaultdict
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import date
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
-from currency_converter import CurrencyConverter
-from numpy import clip
+import _brackets
+import _fx
+import numpy as np
+from utils import CACHE_DIR, atomic_write
 
 #
 # csv data retrieval and parsing
@@ -47,9 +53,11 @@ BASE_DIR = Path(__file__).resolve().parent
 MULTIPLIERS_PATH = BASE_DIR / "switzerland-estv-income-rates.csv"
 SCALES_PATH = BASE_DIR / "switzerland-estv-scales.csv"
 
+# layout of the cached .npy tables (see _compile_tables), bump on any change to their names, shapes or meaning
+TABLES_VERSION = 1
 
-@lru_cache(maxsize=None)
-def _multipliers() -> Dict[str, Dict[str, object]]:
+
+def _parse_multipliers_csv() -> Dict[str, Dict[str, object]]:
     result: Dict[str, Dict[str, object]] = {}
     with MULTIPLIERS_PATH.open(encoding="utf-8", newline="") as handle:
         reader = csv.reader(handle)
@@ -90,8 +98,7 @@ def _multipliers() -> Dict[str, Dict[str, object]]:
     return result
 
 
-@lru_cache(maxsize=None)
-def _tax_scales() -> Tuple[Dict[str, Tuple[str, Iterable]], Dict[Tuple[str, str], Tuple[str, Iterable]]]:
+def _parse_scales_csv() -> Tuple[Dict[str, Tuple[str, Iterable]], Dict[Tuple[str, str], Tuple[str, Iterable]]]:
     federal_entries = defaultdict(list)
     canton_entries: Dict[Tuple[str, str], Dict[str, Iterable]] = {}
 
@@ -155,6 +162,101 @@ def _tax_scales() -> Tuple[Dict[str, Tuple[str, Iterable]], Dict[Tuple[str, str]
     return federal_scales, canton_scales
 
 
+#
+# compiled tables
+#
+# the parsed csvs are compiled into .npy arrays under the cache dir, keyed by a hash of both files, and memory-mapped
+# from then on. the csvs are only parsed again when they change.
+#
+
+FEDERAL = "Confederation"
+
+
+def _compile_tables() -> Dict[str, np.ndarray]:
+    multipliers = _parse_multipliers_csv()
+    communes = [(canton_code, entry["canton_multiplier"], commune) for canton_code, entry in multipliers.items() for commune in entry["communes"].values()]
+
+    federal_scales, canton_scales = _parse_scales_csv()
+    scales = [(FEDERAL, entity, scale) for entity, scale in federal_scales.items()]
+    scales += [(canton_code, entity, scale) for (canton_code, entity), scale in canton_scales.items()]
+    scale_rows = [rows if kind != "flat" else (rows,) for _, _, (kind, rows) in scales]
+
+    return {
+        "commune_canton": np.array([canton_code for canton_code, _, _ in communes]),
+        "commune_name": np.array([commune["name"] for _, _, commune in communes]),
+        "canton_multiplier": np.array([canton_multiplier for _, canton_multiplier, _ in communes], dtype=np.float64),
+        "commune_multiplier": np.array([commune["commune_multiplier"] for _, _, commune in communes], dtype=np.float64),
+        "protestant_multiplier": np.array([commune["church_multipliers"]["protestant"] for _, _, commune in communes], dtype=np.float64),
+        "roman_multiplier": np.array([commune["church_multipliers"]["roman catholic"] for _, _, commune in communes], dtype=np.float64),
+        "christian_multiplier": np.array([commune["church_multipliers"]["christian catholic"] for _, _, commune in communes], dtype=np.float64),
+        "scale_canton": np.array([canton_code for canton_code, _, _ in scales]),
+        "scale_entity": np.array([entity for _, entity, _ in scales]),
+        "scale_kind": np.array([kind for _, _, (kind, _) in scales]),
+        "scale_stop": np.cumsum([len(rows) for rows in scale_rows]),
+        "scale_rows": np.array([tuple(row) + (np.nan,) * (3 - len(row)) for rows in scale_rows for row in rows], dtype=np.float64),
+    }
+
+
+@lru_cache(maxsize=None)
+def _tables() -> Dict[str, np.ndarray]:
+    digest = hashlib.sha1(MULTIPLIERS_PATH.read_bytes() + SCALES_PATH.read_bytes()).hexdigest()[:16]
+    directory = CACHE_DIR / f"switzerland_v{TABLES_VERSION}_{digest}"
+    if directory.is_dir():
+        return {path.stem: np.load(path, mmap_mode="r") for path in directory.glob("*.npy")}
+
+    tables = _compile_tables()
+    with suppress(OSError), atomic_write(directory, directory=True) as temporary:
+        for name, values in tables.items():
+            np.save(temporary / f"{name}.npy", values)
+    return tables
+
+
+@dataclass
+class _CommuneIndex:
+    # one row per commune, grouped by canton
+    cantons: Tuple[str, ...]
+    canton_rows: Dict[str, slice]
+    canton_id: np.ndarray
+    names: np.ndarray
+    canton_multiplier: np.ndarray
+    commune_multiplier: np.ndarray
+    church_multipliers: np.ndarray  # rows × CHURCHES
+    rows: Dict[Tuple[str, str], int]  # (canton, casefolded commune name) -> row
+
+
+CHURCHES = ("protestant", "roman catholic", "christian catholic")
+
+
+@lru_cache(maxsize=None)
+def _commune_index() -> _CommuneIndex:
+    tables = _tables()
+    communes = tables["commune_canton"].tolist()
+    assert communes, "empty multiplier csv"
+    cantons = tuple(dict.fromkeys(communes))
+    canton_id = np.array([cantons.index(canton_code) for canton_code in communes], dtype=np.int16)
+    bounds = np.searchsorted(canton_id, np.arange(len(cantons) + 1))
+    return _CommuneIndex(
+        cantons=cantons,
+        canton_rows={canton_code: slice(int(bounds[i]), int(bounds[i + 1])) for i, canton_code in enumerate(cantons)},
+        canton_id=canton_id,
+        names=np.asarray(tables["commune_name"]),
+        canton_multiplier=np.asarray(tables["canton_multiplier"]),
+        commune_multiplier=np.asarray(tables["commune_multiplier"]),
+        church_multipliers=np.column_stack([tables["protestant_multiplier"], tables["roman_multiplier"], tables["christian_multiplier"]]),
+        rows={(canton_code, name.casefold()): row for row, (canton_code, name) in enumerate(zip(communes, tables["commune_name"].tolist()))},
+    )
+
+
+@lru_cache(maxsize=None)
+def _scale_rows() -> Dict[Tuple[str, str], Tuple[str, np.ndarray]]:
+    # (canton or FEDERAL, entity) -> kind, rows as parsed from the scales csv
+    tables = _tables()
+    stops = tables["scale_stop"].tolist()
+    scales = {(canton_code, entity): (kind, tables["scale_rows"][start:stop]) for canton_code, entity, kind, start, stop in zip(tables["scale_canton"].tolist(), tables["scale_entity"].tolist(), tables["scale_kind"].tolist(), [0] + stops[:-1], stops)}
+    assert any(canton_code == FEDERAL for canton_code, _ in scales), "missing federal scales"
+    return scales
+
+
 CANTON_CAPITALS: Dict[str, str] = {
     "AG": "Aarau",
     "AI": "Appenzell",
@@ -214,108 +316,98 @@ CANTON_NAME_ALIASES: Dict[str, Tuple[str, ...]] = {
 }
 
 
-def _resolve_canton_code(raw_canton: str, multipliers: Dict[str, Dict[str, object]]) -> str:
+def _resolve_canton_code(raw_canton: str, index: _CommuneIndex) -> str:
     # resolve user input to a canton code
     candidate = raw_canton.strip().upper()
-    if candidate in multipliers:
+    if candidate in index.canton_rows:
         return candidate
 
     alias_map = {name.strip().casefold(): code for code, capital in CANTON_CAPITALS.items() for name in {code, capital, *CANTON_NAME_ALIASES.get(code, ())}}
     code = alias_map.get(raw_canton.strip().casefold())
     assert code, "unknown canton"
-    assert code in multipliers, "missing canton multipliers"
+    assert code in index.canton_rows, "missing canton multipliers"
     return code
 
 
-def _select_commune_entry(
-    canton_code: str,
-    requested_commune: str | None,
-    multipliers: Dict[str, Dict[str, object]],
-) -> Dict[str, object]:
-    # pick the commune record matching request or defaults
-    commune_map = multipliers[canton_code]["communes"]
-    assert commune_map, "missing commune data"
-
+def _commune_row(canton_code: str, requested_commune: str | None, index: _CommuneIndex) -> int:
+    # row of the commune matching request or defaults
     if requested_commune:
-        lookup = requested_commune.strip().casefold()
-        assert lookup in commune_map, "unknown commune"
-        return commune_map[lookup]
+        row = index.rows.get((canton_code, requested_commune.strip().casefold()))
+        assert row is not None, "unknown commune"
+        return row
 
     capital = CANTON_CAPITALS.get(canton_code)
-    if capital:
-        capital_key = capital.strip().casefold()
-        if capital_key in commune_map:
-            return commune_map[capital_key]
+    if capital and (canton_code, capital.strip().casefold()) in index.rows:
+        return index.rows[(canton_code, capital.strip().casefold())]
+
+    return index.canton_rows[canton_code].start
+
 
-    return next(iter(commune_map.values()))
+def _resolve_row(canton: str, commune: str | None) -> int:
+    # validated commune index row of a canton / commune request
+    index = _commune_index()
+    assert canton in index.canton_rows, "invalid canton"
+    assert (not commune) or (canton, commune.strip().casefold()) in index.rows, "invalid commune"
+    canton_code = _resolve_canton_code(canton, index)
+    return _commune_row(canton_code, commune, index)
 
 
-def _find_canton_scale(
-    canton_code: str,
-    canton_scales: Dict[Tuple[str, str], Tuple[str, Iterable]],
-) -> Tuple[str, Iterable]:
+# scale entities of each household type, most specific first. deductions stay those of a single earner; households
+# only differ by the federal and canton scales they are taxed at (cantons with one scale for all use it for everyone).
+HOUSEHOLD_ENTITIES: Dict[str, Tuple[str, ...]] = {
+    "single": ("Single, no children", "Single, with / no children", "Single", "All"),
+    "married": ("Married", "Married/Single, with children", "Married/Single, with children (not cohabiting)", "All"),
+    "single_with_children": ("Married/Single, with children (not cohabiting)", "Married/Single, with children", "Single, with / no children", "Single", "All"),
+    "married_with_children": ("Married/Single, with children", "Married/Single, with children (not cohabiting)", "Married", "All"),
+}
+
+
+@lru_cache(maxsize=None)
+def _canton_entity(canton_code: str, household: str = "single") -> str:
     # choose best matching canton scale for entity
-    preferred_entities = ["Single, no children", "Single, with / no children", "Single", "All"]
-    for candidate in preferred_entities:
-        key = (canton_code, candidate)
-        if key in canton_scales:
-            return canton_scales[key]
+    assert household in HOUSEHOLD_ENTITIES, "unknown household"
+    for candidate in HOUSEHOLD_ENTITIES[household]:
+        if (canton_code, candidate) in _scale_rows():
+            return candidate
     assert False
 
 
+def _federal_entity(household: str) -> str:
+    assert household in HOUSEHOLD_ENTITIES, "unknown household"
+    return "Single, no children" if household == "single" else "Married/Single, with children"
+
+
 #
 # tax calculation logic
 #
 
 
-def _apply_tax_scale(scale: Tuple[str, Iterable], amount: float) -> float:
-    # route amount through the configured scale kind
-    # a) stepwise tax across bracket portions
-    # b) threshold table entries
-    # c) flat tax from rate and base
-
-    if amount <= 0:
-        return 0.0
-
-    def _step_tax(amount: float, brackets: Iterable[Tuple[float, float]]) -> float:
-        remaining = amount
-        tax = 0.0
-        for portion, rate in brackets:
-            if remaining <= 0:
-                break
-            take = remaining if math.isinf(portion) else min(remaining, portion)
-            tax += take * rate
-            remaining -= take
-        return tax
-
-    def _threshold_tax(amount: float, entries: Iterable[Tuple[float, float, float]]) -> float:
-        tax = 0.0
-        for index, (threshold, base, rate) in enumerate(entries):
-            if amount < threshold:
-                break
-            next_threshold = entries[index + 1][0] if index + 1 < len(entries) else float("inf")
-            taxable_segment = min(amount, next_threshold) - threshold
-            tax = base + taxable_segment * rate
-            if amount <= next_threshold:
-                break
-        return tax
-
-    def _flat_tax(amount: float, params: Tuple[float, float]) -> float:
-        rate, base = params
-        return amount * rate + base
-
-    kind, data = scale
-    calculators = {
-        "step": lambda rows: _step_tax(amount, rows),
-        "threshold": lambda rows: _threshold_tax(amount, rows),
-        "flat": lambda params: _flat_tax(amount, params),
+@lru_cache(maxsize=None)
+def _compiled_scale(canton_code: str, entity: str) -> _brackets.Brackets:
+    # each scale kind as one bracket table, called with a float or .many() with an array
+    # a) stepwise tax across bracket portions: brackets start at the running sum of the portions
+    # b) threshold table entries: an amount falls in the first bracket whose successor threshold is not below it
+    # c) flat tax from rate and base: one bracket from 0
+    assert (canton_code, entity) in _scale_rows(), "missing tax scale"
+    kind, rows = _scale_rows()[(canton_code, entity)]
+
+    if kind == "step":
+        return _brackets.marginal(rows[:, :2].tolist())
+
+    if kind == "threshold":
+        return _brackets.thresholds(rows.tolist())
+
+    assert kind == "flat", "unsupported scale"
+    rate, base = rows[0, 0], rows[0, 1]
+    return _brackets.flat(rate, base)
+
+
+def scale_cache_info() -> Dict[str, object]:
+    # hit / miss counters of the compiled scale caches
+    return {
+        "entity": _canton_entity.cache_info(),
+        "compiled": _compiled_scale.cache_info(),
     }
-    handler = calculators.get(kind)
-    assert handler, "unsupported scale"
-
-    if kind == "flat" and isinstance(data, (list, tuple)) and data and isinstance(data[0], tuple):
-        data = data[0]
-    return handler(data)
 
 
 def _compute_social_contributions(gross_income: float, age: int) -> Tuple[float, float, float, float]:
@@ -329,7 +421,7 @@ def _compute_social_contributions(gross_income: float, age: int) -> Tuple[float,
         return oasi, unemployment, accident, 0.0
 
     coord_lower, coord_upper, coordination_deduction = 3_585, 60_945, 25_095
-    insured_salary = clip(max(0.0, gross_income - coordination_deduction), coord_lower, coord_upper)
+    insured_salary = min(max(gross_income - coordination_deduction, 0.0, coord_lower), coord_upper)
     extra_salary = max(0.0, gross_income - (coordination_deduction + coord_upper))
 
     age_brackets = ((55, 0.09), (45, 0.075), (35, 0.05), (25, 0.035))
@@ -343,29 +435,39 @@ def _compute_social_contributions(gross_income: float, age: int) -> Tuple[float,
     return oasi, unemployment, accident, pension
 
 
-def net_salary(
-    gross_annual_salary: int,
-    canton: str = "ZH",
-    commune: str | None = None,
-    age: int = 30,
-    input_currency: str = "EUR",
-    output_currency: str = "EUR",
-    other_deductions: float = 0.0,
-) -> int:
-    # assume single, atheist, no children unless
-    # based on: https://swisstaxcalculator.estv.admin.ch/#/calculator/income-wealth-tax
-    converter = CurrencyConverter()
-    if input_currency.upper() == "EUR":
-        gross_annual_salary = converter.convert(gross_annual_salary, "EUR", "CHF")
+def _social_contributions_many(gross_income: np.ndarray, age: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # _compute_social_contributions elementwise
+    capped = np.minimum(gross_income, 148_200)
+    oasi = np.round(gross_income * 0.053)
+    unemployment = np.round(capped * 0.011)
+    accident = np.round(capped * 0.004)
 
-    multipliers = _multipliers()
-    assert canton in multipliers, "invalid canton"
-    assert (not commune) or commune.strip().casefold() in multipliers[canton]["communes"], "invalid commune"
-    canton_code = _resolve_canton_code(canton, multipliers)
-    commune_entry = _select_commune_entry(canton_code, commune, multipliers)
+    coord_lower, coord_upper, coordination_deduction = 3_585, 60_945, 25_095
+    insured_salary = np.clip(np.maximum(0.0, gross_income - coordination_deduction), coord_lower, coord_upper)
+    extra_salary = np.maximum(0.0, gross_income - (coordination_deduction + coord_upper))
 
-    federal_scales, canton_scales = _tax_scales()
-    canton_scale = _find_canton_scale(canton_code, canton_scales)
+    rate = np.select([age >= 55, age >= 45, age >= 35, age >= 25], [0.09, 0.075, 0.05, 0.035], 0.0)
+
+    extra_transition = 3_966.0
+    extra_first = np.minimum(extra_salary, extra_transition)
+    extra_rest = np.maximum(0.0, extra_salary - extra_transition)
+    pension = np.where(gross_income <= 21_510, 0.0, np.round(insured_salary * rate + extra_first * 0.023 + extra_rest * rate))
+
+    return oasi, unemployment, accident, pension
+
+
+def _net_local(
+    gross_annual_salary: float,
+    canton: str,
+    commune: str | None,
+    age: int,
+    other_deductions: float,
+    household: str = "single",
+) -> float:
+    # unrounded net in CHF
+    index = _commune_index()
+    row = _resolve_row(canton, commune)
+    canton_code = index.cantons[index.canton_id[row]]
 
     oasi, unemployment, accident, pension = _compute_social_contributions(gross_annual_salary, age)
     social_total = sum((oasi, unemployment, accident, pension))
@@ -373,7 +475,7 @@ def net_salary(
     net_income_after_social = gross_annual_salary - social_total
 
     min_professional, max_professional = 2_000.0, 4_000.0
-    other_professional = clip(math.floor(net_income_after_social * 0.03), min_professional, max_professional)
+    other_professional = min(max(math.floor(net_income_after_social * 0.03), min_professional), max_professional)
     insurance_canton = 2_900.0
     insurance_federal = 1_800.0
 
@@ -381,11 +483,11 @@ def net_salary(
     taxable_income_canton = max(0.0, net_income_after_social - other_professional - insurance_canton - deduction_pool)
     taxable_income_federal = max(0.0, net_income_after_social - other_professional - insurance_federal - deduction_pool)
 
-    federal_tax_raw = _apply_tax_scale(federal_scales.get("Single, no children"), taxable_income_federal)
-    canton_base_tax = _apply_tax_scale(canton_scale, taxable_income_canton)
+    federal_tax_raw = _compiled_scale(FEDERAL, _federal_entity(household))(taxable_income_federal)
+    canton_base_tax = _compiled_scale(canton_code, _canton_entity(canton_code, household))(taxable_income_canton)
 
-    canton_multiplier = multipliers[canton_code]["canton_multiplier"]
-    commune_multiplier = commune_entry["commune_multiplier"]
+    canton_multiplier = float(index.canton_multiplier[row])
+    commune_multiplier = float(index.commune_multiplier[row])
 
     base_tax_int = math.floor(canton_base_tax)
     cantonal_tax = round(base_tax_int * canton_multiplier)
@@ -394,8 +496,285 @@ def net_salary(
 
     personal_tax = 24.0  # small constant, dropped detailed calculation per canton
     total_tax = federal_tax + cantonal_tax + communal_tax + personal_tax
-    net_income = gross_annual_salary - social_total - total_tax
+    return gross_annual_salary - social_total - total_tax
+
+
+def _commune_free_part(
+    gross_annual_salary: np.ndarray,
+    age: np.ndarray,
+    other_deductions: np.ndarray,
+    household: str = "single",
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # everything of _net_local that does not depend on the commune, elementwise:
+    # social contributions, federal tax and the income taxed by the canton scale
+    social_total = sum(_social_contributions_many(gross_annual_salary, age))
+    net_income_after_social = gross_annual_salary - social_total
+
+    other_professional = np.clip(np.floor(net_income_after_social * 0.03), 2_000.0, 4_000.0)
+    deduction_pool = np.maximum(0.0, other_deductions)
+    taxable_income_canton = np.maximum(0.0, net_income_after_social - other_professional - 2_900.0 - deduction_pool)
+    taxable_income_federal = np.maximum(0.0, net_income_after_social - other_professional - 1_800.0 - deduction_pool)
+
+    federal_tax = np.floor(_compiled_scale(FEDERAL, _federal_entity(household)).many(taxable_income_federal) + 0.004)
+    return social_total, federal_tax, taxable_income_canton
+
+
+def _canton_base_tax(canton_code: str, taxable_income_canton: np.ndarray, household: str = "single") -> np.ndarray:
+    return _compiled_scale(canton_code, _canton_entity(canton_code, household)).many(taxable_income_canton)
+
+
+def _commune_net(
+    gross_annual_salary: np.ndarray,
+    social_total: np.ndarray,
+    federal_tax: np.ndarray,
+    canton_base_tax: np.ndarray,
+    row: np.ndarray,
+) -> np.ndarray:
+    # net from the commune-free part and the canton base tax, taxed at the multipliers of the commune rows
+    index = _commune_index()
+    base_tax_int = np.floor(canton_base_tax)
+    cantonal_tax = np.round(base_tax_int * index.canton_multiplier[row])
+    communal_tax = np.round(base_tax_int * index.commune_multiplier[row])
+
+    total_tax = federal_tax + cantonal_tax + communal_tax + 24.0
+    return gross_annual_salary - social_total - total_tax
+
+
+def _net_local_many(
+    gross_annual_salary: np.ndarray,
+    row: np.ndarray,
+    age: np.ndarray,
+    other_deductions: np.ndarray,
+    household: str = "single",
+) -> np.ndarray:
+    # _net_local elementwise, communes given as index rows
+    index = _commune_index()
+    gross_annual_salary, row, age, other_deductions = np.broadcast_arrays(np.asarray(gross_annual_salary, dtype=np.float64), row, age, other_deductions)
+    social_total, federal_tax, taxable_income_canton = _commune_free_part(gross_annual_salary, age, other_deductions, household)
+
+    canton_base_tax = np.zeros_like(gross_annual_salary)
+    canton_id = index.canton_id[row]
+    for canton in np.unique(canton_id):
+        mask = canton_id == canton
+        canton_base_tax[mask] = _canton_base_tax(index.cantons[canton], taxable_income_canton[mask], household)
+
+    return _commune_net(gross_annual_salary, social_total, federal_tax, canton_base_tax, row)
+
+
+def net_salary(
+    gross_annual_salary: int,
+    canton: str = "ZH",
+    commune: str | None = None,
+    age: int = 30,
+    input_currency: str = "EUR",
+    output_currency: str = "EUR",
+    other_deductions: float = 0.0,
+    household: str = "single",
+) -> int:
+    # assume atheist, single with no children unless household is one of HOUSEHOLD_ENTITIES
+    # based on: https://swisstaxcalculator.estv.admin.ch/#/calculator/income-wealth-tax
+    if input_currency.upper() == "EUR":
+        gross_annual_salary = _fx.convert(gross_annual_salary, "EUR", "CHF")
+
+    net_income = _net_local(gross_annual_salary, canton, commune, age, other_deductions, household)
 
     if output_currency.upper() == "EUR":
-        return int(converter.convert(net_income, "CHF", "EUR"))
+        return int(_fx.convert(net_income, "CHF", "EUR"))
     return int(net_income)
+
+
+def net_salary_many(
+    gross_annual_salaries: np.ndarray,
+    canton: str | np.ndarray = "ZH",
+    commune: str | None | np.ndarray = None,
+    age: int | np.ndarray = 30,
+    input_currency: str = "EUR",
+    output_currency: str = "EUR",
+    other_deductions: float | np.ndarray = 0.0,
+    household: str = "single",
+) -> np.ndarray:
+    # net_salary elementwise, as int64. canton, commune, age and other_deductions are scalars or arrays that broadcast
+    # against the salaries; each distinct canton scale is evaluated once over all of its salaries.
+    gross_annual_salaries = np.asarray(gross_annual_salaries, dtype=np.float64)
+    if input_currency.upper() == "EUR":
+        gross_annual_salaries = _fx.convert(gross_annual_salaries, "EUR", "CHF")
+
+    cantons, communes = np.broadcast_arrays(np.asarray(canton, dtype=object), np.asarray(commune, dtype=object))
+    pairs = list(zip(cantons.ravel().tolist(), communes.ravel().tolist()))
+    resolved = {pair: _resolve_row(*pair) for pair in set(pairs)}
+    rows = np.array([resolved[pair] for pair in pairs], dtype=np.intp).reshape(cantons.shape)
+
+    net_income = _net_local_many(gross_annual_salaries, rows, age, other_deductions, household)
+
+    if output_currency.upper() == "EUR":
+        net_income = _fx.convert(net_income, "CHF", "EUR")
+    return np.trunc(net_income).astype(np.int64)
+
+
+def net_salary_households(
+    gross_annual_salaries: np.ndarray,
+    canton: str | Iterable[str] = "ZH",
+    commune: str | None = None,
+    age: int = 30,
+    input_currency: str = "EUR",
+    output_currency: str = "EUR",
+    other_deductions: float = 0.0,
+) -> Tuple[Tuple[str, ...], np.ndarray]:
+    # net_salary for every household type: the household types, and a household × salary int64 matrix, with a leading
+    # canton axis when canton is not a string (each canton at its default commune). households taxed at the same scale
+    # share its evaluation, so each distinct federal and canton scale is evaluated once per salary.
+    index = _commune_index()
+    gross_annual_salaries = np.ravel(np.asarray(gross_annual_salaries, dtype=np.float64))
+    if input_currency.upper() == "EUR":
+        gross_annual_salaries = _fx.convert(gross_annual_salaries, "EUR", "CHF")
+
+    cantons = [canton] if isinstance(canton, str) else list(canton)
+    rows = [_resolve_row(canton_code, commune if isinstance(canton, str) else None) for canton_code in cantons]
+
+    net_income = np.empty((len(rows), len(HOUSEHOLD_ENTITIES), len(gross_annual_salaries)))
+    commune_free_parts: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    canton_base_taxes: Dict[Tuple[str, str], np.ndarray] = {}
+    for column, household in enumerate(HOUSEHOLD_ENTITIES):
+        federal_entity = _federal_entity(household)
+        if federal_entity not in commune_free_parts:
+            commune_free_parts[federal_entity] = _commune_free_part(gross_annual_salaries, age, other_deductions, household)
+        social_total, federal_tax, taxable_income_canton = commune_free_parts[federal_entity]
+
+        for position, row in enumerate(rows):
+            canton_code = index.cantons[index.canton_id[row]]
+            key = (canton_code, _canton_entity(canton_code, household))
+            if key not in canton_base_taxes:
+                canton_base_taxes[key] = _compiled_scale(*key).many(taxable_income_canton)
+            net_income[position, column] = _commune_net(gross_annual_salaries, social_total, federal_tax, canton_base_taxes[key], row)
+
+    if output_currency.upper() == "EUR":
+        net_income = _fx.convert(net_income, "CHF", "EUR")
+    net_income = np.trunc(net_income).astype(np.int64)
+    return tuple(HOUSEHOLD_ENTITIES), net_income[0] if isinstance(canton, str) else net_income
+
+
+def age_profile(
+    gross_annual_salaries: np.ndarray,
+    ages: Iterable[int] = range(25, 66),
+    canton: str = "ZH",
+    commune: str | None = None,
+    input_currency: str = "EUR",
+    output_currency: str = "EUR",
+    other_deductions: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # a career at constant gross salaries: the ages, and age × salary matrices of net_salary (int64) and of the
+    # employee bvg pension contributions (float64), both in output_currency
+    gross_annual_salaries = np.ravel(np.asarray(gross_annual_salaries, dtype=np.float64))
+    if input_currency.upper() == "EUR":
+        gross_annual_salaries = _fx.convert(gross_annual_salaries, "EUR", "CHF")
+    ages = np.asarray(list(ages), dtype=np.int64)
+
+    net_income = _net_local_many(gross_annual_salaries[None, :], _resolve_row(canton, commune), ages[:, None], other_deductions)
+    _, _, _, pension = _social_contributions_many(gross_annual_salaries[None, :], ages[:, None])
+    pension = np.broadcast_to(pension, net_income.shape).astype(np.float64)
+
+    if output_currency.upper() == "EUR":
+        net_income = _fx.convert(net_income, "CHF", "EUR")
+        pension = _fx.convert(pension, "CHF", "EUR")
+    return ages, np.trunc(net_income).astype(np.int64), pension
+
+
+PILLAR_3A_CAP = 7_258.0  # 2025, employees with a pension fund
+
+
+def optimize_deductions(
+    gross_annual_salaries: np.ndarray,
+    canton: str | Iterable[str] = "ZH",
+    commune: str | None = None,
+    age: int = 30,
+    cap: float = PILLAR_3A_CAP,
+    step: float = 100.0,
+    retirement_value: float = 1.0,
+    input_currency: str = "EUR",
+    output_currency: str = "EUR",
+) -> Dict[str, np.ndarray]:
+    # net_salary over a grid of other_deductions (pillar 3a payments, CHF) from 0 to cap for every salary, and one or
+    # several cantons (at their default commune when more than one is given).
+    # a CHF paid into pillar 3a leaves the net but is worth retirement_value CHF later, so the optimal deduction is the
+    # one maximizing net - deduction * (1 - retirement_value); the smallest one on ties.
+    # shapes: deduction × salary, with a leading canton axis when canton is not a string.
+    gross_annual_salaries = np.ravel(np.asarray(gross_annual_salaries, dtype=np.float64))
+    if input_currency.upper() == "EUR":
+        gross_annual_salaries = _fx.convert(gross_annual_salaries, "EUR", "CHF")
+    assert cap >= 0 and step > 0, "invalid deduction grid"
+    deductions = np.append(np.arange(0.0, cap, step), cap)
+
+    cantons = [canton] if isinstance(canton, str) else list(canton)
+    rows = np.array([_resolve_row(canton_code, commune if isinstance(canton, str) else None) for canton_code in cantons])
+    net_income = _net_local_many(gross_annual_salaries, rows[:, None, None], age, deductions[:, None])
+
+    marginal_saving = np.diff(net_income, axis=1) / np.diff(deductions)[:, None]
+    value = net_income - deductions[:, None] * (1 - retirement_value)
+    best = np.argmax(value, axis=1)
+    optimal_value = np.take_along_axis(value, best[:, None, :], axis=1)[:, 0, :]
+
+    if output_currency.upper() == "EUR":
+        net_income = _fx.convert(net_income, "CHF", "EUR")
+        optimal_value = _fx.convert(optimal_value, "CHF", "EUR")
+    result = {
+        "deductions": deductions,
+        "net_salary": np.trunc(net_income).astype(np.int64),
+        "marginal_saving": marginal_saving,
+        "optimal_deduction": deductions[best],
+        "optimal_value": optimal_value,
+    }
+    if isinstance(canton, str):
+        result.update({key: values[0] for key, values in result.items() if key != "deductions"})
+    return result
+
+
+def sweep_communes(
+    gross_annual_salaries: np.ndarray,
+    age: int = 30,
+    input_currency: str = "EUR",
+    output_currency: str = "EUR",
+    other_deductions: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # net_salary for every commune of the income-rates csv: the canton code and name of each commune, and a
+    # commune × salary int64 matrix. contributions and federal tax are computed once per salary and the canton base tax
+    # once per canton and salary; only the multipliers are applied per commune.
+    index = _commune_index()
+    gross_annual_salaries = np.ravel(np.asarray(gross_annual_salaries, dtype=np.float64))
+    if input_currency.upper() == "EUR":
+        gross_annual_salaries = _fx.convert(gross_annual_salaries, "EUR", "CHF")
+
+    social_total, federal_tax, taxable_income_canton = _commune_free_part(gross_annual_salaries, age, other_deductions)
+    canton_base_tax = np.stack([_canton_base_tax(canton_code, taxable_income_canton) for canton_code in index.cantons])
+    rows = np.arange(len(index.names))[:, None]
+    net_income = _commune_net(gross_annual_salaries, social_total, federal_tax, canton_base_tax[index.canton_id], rows)
+
+    if output_currency.upper() == "EUR":
+        net_income = _fx.convert(net_income, "CHF", "EUR")
+    return np.array(index.cantons)[index.canton_id], index.names, np.trunc(net_income).astype(np.int64)
+
+
+def best_communes(
+    gross_annual_salaries: np.ndarray,
+    count: int = 10,
+    **kwargs,
+) -> list[list[Tuple[str, str, int]]]:
+    # per salary, the count communes with the highest net salary as (canton, commune, net), best first
+    cantons, communes, nets = sweep_communes(gross_annual_salaries, **kwargs)
+    order = np.argsort(-nets, axis=0, kind="stable")[:count]
+    return [[(str(cantons[row]), str(communes[row]), int(nets[row, column])) for row in order[:, column]] for column in range(nets.shape[1])]
+
+
+def net_salary_history(
+    gross_annual_salaries: np.ndarray,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    canton: str = "ZH",
+    commune: str | None = None,
+    age: int = 30,
+    other_deductions: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    # CHF offers in EUR over time: the ecb dates in [start, end] and a date × salary matrix of
+    # net_salary(gross, input_currency="CHF", ...) at the rates of each date. the CHF net is computed once per salary.
+    nets = _net_local_many(np.ravel(gross_annual_salaries), _resolve_row(canton, commune), age, other_deductions)
+    dates, converted = _fx.convert_history(nets, "CHF", "EUR", start, end)
+    return dates, np.trunc(converted).astype(np.int64)
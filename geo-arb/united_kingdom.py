@@ -27,19 +27,48 @@ ANNUAL_EXPENSES = sum(EXPENSES_BREAKDOWN.values()) * 12
 #
 
 
-from currency_converter import CurrencyConverter
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+
+import _brackets
+import _fx
+import _piecewise
+import numpy as np
+
+# personal allowance, withdrawn at 1 GBP per 2 GBP above 100k, ITA 2007 s35
+PERSONAL_ALLOWANCE = _brackets.taper(12570.0, 100000.0, 0.50)
+TAX_BANDS = ((37700.0, 0.20), (87440.0, 0.40), (None, 0.45))
+NATIONAL_INSURANCE_BANDS = ((12570.0, 0.00), (37700.0, 0.08), (None, 0.02))
+
+_INCOME_TAX = _brackets.marginal(TAX_BANDS)
+_NATIONAL_INSURANCE = _brackets.marginal(NATIONAL_INSURANCE_BANDS)
+
+
+@lru_cache(maxsize=None)
+def _marginal(bands) -> _brackets.Brackets:
+    return _brackets.marginal(bands)
 
 
 def progressive_charge(amount: float, bands) -> float:
-    total = 0.0
-    remaining = max(amount, 0.0)
-    for width, rate in bands:
-        if remaining <= 0:
-            break
-        taxable = remaining if width is None else min(remaining, width)
-        total += taxable * rate
-        remaining -= taxable
-    return total
+    # (width, rate) bands, the last width None
+    return _marginal(tuple(map(tuple, bands)))(amount)
+
+
+def _net_local(gross_annual_salary: float) -> float:
+    # net in GBP, rounded to whole pounds
+    taxable = max(gross_annual_salary - PERSONAL_ALLOWANCE(gross_annual_salary), 0.0)
+    tax = round(_INCOME_TAX(taxable))
+    national_insurance = round(_NATIONAL_INSURANCE(gross_annual_salary))
+    return round(gross_annual_salary - tax - national_insurance)
+
+
+def _net_local_many(gross_annual_salary: np.ndarray) -> np.ndarray:
+    # _net_local elementwise, np.rint rounds half to even like round()
+    taxable = np.maximum(gross_annual_salary - PERSONAL_ALLOWANCE.many(gross_annual_salary), 0.0)
+    tax = np.rint(_INCOME_TAX.many(taxable))
+    national_insurance = np.rint(_NATIONAL_INSURANCE.many(gross_annual_salary))
+    return np.rint(gross_annual_salary - tax - national_insurance)
 
 
 def net_salary(
@@ -50,25 +79,74 @@ def net_salary(
     # based on:
     # https://www.gov.uk/estimate-income-tax
     # https://github.com/hmrc/income-tax-calculation/
-    converter = CurrencyConverter()
     if input_currency.upper() == "EUR":
-        gross_annual_salary = converter.convert(gross_annual_salary, "EUR", "GBP")
-
-    PERSONAL_ALLOWANCE = 12570.0
-    TAPER_START = 100000.0
-    TAPER_RATE = 0.50
-    TAX_BANDS = ((37700.0, 0.20), (87440.0, 0.40), (None, 0.45))
-    NATIONAL_INSURANCE_BANDS = ((12570.0, 0.00), (37700.0, 0.08), (None, 0.02))
-
-    allowance = PERSONAL_ALLOWANCE
-    if gross_annual_salary > TAPER_START:
-        allowance -= (gross_annual_salary - TAPER_START) * TAPER_RATE
-        allowance = max(allowance, 0.0)
-    taxable = max(gross_annual_salary - allowance, 0.0)
-    tax = round(progressive_charge(taxable, TAX_BANDS))
-    national_insurance = round(progressive_charge(gross_annual_salary, NATIONAL_INSURANCE_BANDS))
-    net = round(gross_annual_salary - tax - national_insurance)
+        gross_annual_salary = _fx.convert(gross_annual_salary, "EUR", "GBP")
+
+    net = _net_local(gross_annual_salary)
 
     if output_currency.upper() == "EUR":
-        return int(converter.convert(net, "GBP", "EUR"))
+        return int(_fx.convert(net, "GBP", "EUR"))
     return int(round(net))
+
+
+def net_salary_many(
+    gross_annual_salaries: np.ndarray,
+    input_currency: str = "EUR",
+    output_currency: str = "EUR",
+) -> np.ndarray:
+    # net_salary elementwise, as int64
+    gross_annual_salaries = np.asarray(gross_annual_salaries, dtype=np.float64)
+    if input_currency.upper() == "EUR":
+        gross_annual_salaries = _fx.convert(gross_annual_salaries, "EUR", "GBP")
+
+    net = _net_local_many(gross_annual_salaries)
+
+    if output_currency.upper() == "EUR":
+        return np.trunc(_fx.convert(net, "GBP", "EUR")).astype(np.int64)
+    return net.astype(np.int64)
+
+
+@lru_cache(maxsize=None)
+def net_curve() -> _piecewise.Curve:
+    # _net_local without its rounding steps, exactly: piecewise linear in the GBP gross, with breaks at the bands, the
+    # national insurance thresholds and both ends of the allowance taper (100k and 125140)
+    gross = _piecewise.identity()
+    taxable = (gross - _piecewise.from_brackets(PERSONAL_ALLOWANCE)).maximum(0.0)
+    tax = _piecewise.from_brackets(_INCOME_TAX).of(taxable)
+    national_insurance = _piecewise.from_brackets(_NATIONAL_INSURANCE)
+    return (gross - tax - national_insurance).curve()
+
+
+def gross_for_net(
+    net_annual_salaries: np.ndarray,
+    input_currency: str = "EUR",
+    output_currency: str = "EUR",
+) -> np.ndarray:
+    # the smallest gross (in input_currency) whose net before rounding reaches each net (in output_currency), elementwise
+    net_annual_salaries = np.asarray(net_annual_salaries, dtype=np.float64)
+    if output_currency.upper() == "EUR":
+        net_annual_salaries = _fx.convert(net_annual_salaries, "EUR", "GBP")
+    gross = net_curve().inverse(net_annual_salaries)
+    if input_currency.upper() == "EUR":
+        return _fx.convert(gross, "GBP", "EUR")
+    return gross
+
+
+def marginal_rate(gross_annual_salaries: np.ndarray, input_currency: str = "EUR") -> np.ndarray:
+    # share of the next unit of gross lost to income tax and national insurance, elementwise
+    gross_annual_salaries = np.asarray(gross_annual_salaries, dtype=np.float64)
+    if input_currency.upper() == "EUR":
+        gross_annual_salaries = _fx.convert(gross_annual_salaries, "EUR", "GBP")
+    return 1 - net_curve().slope(gross_annual_salaries)
+
+
+def net_salary_history(
+    gross_annual_salaries: np.ndarray,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    # GBP offers in EUR over time: the ecb dates in [start, end] and a date × salary matrix of
+    # net_salary(gross, input_currency="GBP") at the rates of each date. the GBP net is computed once per salary.
+    nets = _net_local_many(np.ravel(np.asarray(gross_annual_salaries, dtype=np.float64)))
+    dates, converted = _fx.convert_history(nets, "GBP", "EUR", start, end)
+    return dates, np.trunc(converted).astype(np.int64)
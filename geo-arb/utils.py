@@ -1,4 +1,34 @@
+import os
+import shutil
+from contextlib import contextmanager, suppress
 from functools import wraps
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+# per-user cache for compiled snapshots (openfisca parameters, fx rates, ...)
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "geo-arb"
+
+
+@contextmanager
+def atomic_write(path: Path, directory: bool = False) -> Iterator[Path]:
+    # a temporary file (or directory) next to path, renamed to path when the block succeeds and removed in any case, so
+    # concurrent processes never read a partial cache entry. raises OSError when the cache can't be written: callers
+    # that can do without the entry wrap it in suppress(OSError).
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    if directory:
+        temporary.mkdir()
+    try:
+        yield temporary
+        os.replace(temporary, path)
+    finally:
+        with suppress(OSError):
+            if temporary.is_dir():
+                shutil.rmtree(temporary)
+            else:
+                temporary.unlink(missing_ok=True)
 
 
 def suppress_errors(func):  # return none on failure
@@ -12,6 +42,21 @@ def suppress_errors(func):  # return none on failure
     return wrapper
 
 
+def python_round(values: np.ndarray, ndigits: int) -> np.ndarray:
+    # round(value, ndigits) elementwise. np.round scales by 10**ndigits first, which can move a value across an exact
+    # decimal tie, so values close to a tie after scaling are rounded by python instead. 0-d input gives a 0-d array.
+    shape = np.shape(values)
+    values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+    scaled = values * 10.0**ndigits
+    result = np.rint(scaled)
+    # scaling is off by at most half an ulp of each value. nan and inf are never near a tie.
+    with np.errstate(invalid="ignore"):
+        near_tie = np.abs(scaled - result) >= 0.5 - np.abs(scaled) * 1e-15
+    result /= 10.0**ndigits
+    result[near_tie] = [round(value, ndigits) for value in values[near_tie].tolist()]
+    return result.reshape(shape)
+
+
 #
 # mortgage payoff estimate
 #
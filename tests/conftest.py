@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# the country modules import each other by bare name, as in demo.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "geo-arb"))
@@ -0,0 +1,57 @@
+import austria
+import numpy as np
+import pytest
+from utils import python_round
+
+RNG = np.random.default_rng(0)
+# whole-euro salaries around every bracket limit and social insurance cap (monthly gross × 14), plus random ones
+LIMITS = np.array([1037.33, 1620.67, 2704.00, 5173.33, 7760.00, 6090.00, 6450.00]) * 14
+SALARIES = np.unique(np.r_[-1, 0, 1, 13, 14, 15, (LIMITS[:, None] + np.arange(-30, 31)).ravel().astype(np.int64), RNG.integers(0, 400_000, 20_000)])
+
+
+@pytest.mark.parametrize("ndigits", [0, 1, 2, 3])
+def test_python_round_matches_round(ndigits):
+    values = np.r_[RNG.uniform(-1e6, 1e6, 100_000), RNG.integers(-(10**8), 10**8, 100_000) / 10 ** (ndigits + 1), [0.5, 1.5, 2.675, -2.675, 32000.345, 1e15 + 0.5]]
+    assert python_round(values, ndigits).tolist() == [round(value, ndigits) for value in values.tolist()]
+    for value in (2.675, 32000.345, -0.5, 1.5):
+        result = python_round(np.float64(value), ndigits)
+        assert np.ndim(result) == 0 and result == round(value, ndigits)
+        assert python_round(value, ndigits) == round(value, ndigits)
+
+
+def test_python_round_ignores_nan_and_inf():
+    result = python_round(np.array([32000.345, np.nan, np.inf, -np.inf]), 2)
+    assert result[0] == round(32000.345, 2)
+    assert np.isnan(result[1]) and result[2] == np.inf and result[3] == -np.inf
+
+
+def test_net_salary_many_matches_net_salary():
+    assert austria.net_salary_many(SALARIES).tolist() == [austria.net_salary(int(salary)) for salary in SALARIES]
+
+
+def test_net_salary_many_sparse_and_fractional():
+    # few salaries over a wide range skip the per-euro table; fractional salaries truncate like net_salary
+    salaries = np.array([1_000.5, 45_678.99, 1_000_000.25, 2_500_000.0])
+    assert austria.net_salary_many(salaries).tolist() == [austria.net_salary(salary) for salary in salaries]
+
+
+def test_net_curve_matches_net_salary():
+    # net_salary truncates the monthly gross and rounds to cents: it stays below the curve by less than the 14 euros of
+    # gross truncated a year
+    salaries = SALARIES[SALARIES > 0]
+    assert np.abs(austria.net_curve()(salaries) - [austria.net_salary(int(salary)) for salary in salaries]).max() < 15
+
+
+def test_gross_for_net_inverts_net_curve():
+    gross = np.r_[0.0, LIMITS, RNG.uniform(0, 400_000, 10_000)]
+    np.testing.assert_allclose(austria.gross_for_net(austria.net_curve()(gross)), gross, rtol=1e-12, atol=1e-8)
+
+
+def test_marginal_rate_matches_net_salary_differences():
+    # forward differences of net_salary over a step within one segment of the curve
+    step = 5_000
+    curve = austria.net_curve()
+    salaries = RNG.integers(1, 400_000, 2_000)
+    salaries = salaries[np.searchsorted(curve.ends, salaries) == np.searchsorted(curve.ends, salaries + step)]
+    differences = [(austria.net_salary(int(salary) + step) - austria.net_salary(int(salary))) / step for salary in salaries]
+    np.testing.assert_allclose(1 - austria.marginal_rate(salaries), differences, atol=30 / step)
@@ -0,0 +1,111 @@
+import itertools
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import germany
+import numpy as np
+import pytest
+
+SALARIES = np.r_[0, 0.01, 1, 9_999.99, 12_096, 12_097, 40_000, 66_150, 96_600, 96_601, 277_826, 277_827, 1_000_000, np.random.default_rng(0).uniform(0, 400_000, 300).round(2)]
+
+
+@pytest.mark.parametrize("tax_class, health_insurance_type, church_tax, pension_area", itertools.product(range(1, 7), ("statutory", "private"), (False, True), ("west", "east")))
+def test_net_salary_many_matches_net_salary(tax_class, health_insurance_type, church_tax, pension_area):
+    options = dict(tax_class=tax_class, health_insurance_type=health_insurance_type, church_tax=church_tax, pension_area=pension_area)
+    expected = [germany.net_salary(salary, **options, backend="decimal") for salary in SALARIES]
+    assert germany.net_salary_many(SALARIES, **options).tolist() == expected
+
+
+def test_net_salary_many_broadcasts_tax_classes():
+    tax_classes = np.arange(len(SALARIES)) % 6 + 1
+    expected = [germany.net_salary(salary, tax_class=int(tax_class), backend="decimal") for salary, tax_class in zip(SALARIES, tax_classes)]
+    assert germany.net_salary_many(SALARIES, tax_class=tax_classes).tolist() == expected
+
+
+INPUTS = list(itertools.product(range(1, 7), (0, 1), (0, 1, 2), (0, 0.5, 1, 2.5), (0, 1)))  # STKL, PKV, KRV, ZKF, ALTER1
+
+
+@pytest.mark.parametrize("stkl, pkv, krv, zkf, alter1", INPUTS)
+def test_lohnsteuer_cents_matches_decimal_reference(stkl, pkv, krv, zkf, alter1):
+    engine = germany._engine(2025)
+    cents = (SALARIES * 100).astype(np.int64)
+    for re4 in cents.tolist():
+        reference = germany._calculator(2025).reset(RE4=re4, STKL=stkl, LZZ=1, PKV=pkv, KRV=krv, ZKF=zkf, ALTER1=alter1, af=0, f=1, PVS=0, R=0, LZZHINZU=0, PVZ=0)
+        reference.MAIN()
+        expected = (int(reference.getLstlzz()), int(reference.getSolzlzz()), int(reference.getBk()))
+        assert tuple(map(int, engine.lohnsteuer_cents(re4, stkl, pkv, krv, zkf, alter1))) == expected, re4
+    assert [tuple(map(int, values)) for values in zip(*engine.lohnsteuer_cents(cents, stkl, pkv, krv, zkf, alter1))] == [tuple(map(int, engine.lohnsteuer_cents(re4, stkl, pkv, krv, zkf, alter1))) for re4 in cents.tolist()]
+
+
+@pytest.mark.parametrize("stkl, pkv, krv, zkf, alter1", INPUTS)
+def test_int_backend_matches_decimal_backend(stkl, pkv, krv, zkf, alter1):
+    options = dict(tax_class=stkl, health_insurance_type=("statutory", "private")[pkv], pension_area=("west", "east", "seamen")[krv], children=zkf, age_over_64=bool(alter1), church_tax=True)
+    expected = [germany.net_salary(salary, **options, backend="decimal") for salary in SALARIES]
+    assert [germany.net_salary(salary, **options, backend="int") for salary in SALARIES] == expected
+    assert germany.net_salary_many(SALARIES, **options).tolist() == expected
+
+
+def test_decimal_backend_is_thread_safe():
+    salaries = np.random.default_rng(1).uniform(0, 300_000, 2_000).round(2).tolist()
+    expected = [germany.net_salary(salary, tax_class=salary_index % 6 + 1, backend="decimal") for salary_index, salary in enumerate(salaries)]
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda item: germany.net_salary(item[1], tax_class=item[0] % 6 + 1, backend="decimal"), enumerate(salaries)))
+    assert results == expected
+
+
+def test_year_dispatch_selects_the_year_module(monkeypatch):
+    # only 2025 ships, so register a second year whose integer port taxes nothing
+    engine = germany._engine(2025)
+    no_tax = types.ModuleType("_lohnsteuer2024")
+    no_tax.lohnsteuer_cents = lambda re4, *args: tuple(np.zeros_like(np.asarray(value)) for value in engine.lohnsteuer_cents(re4, *args))
+    no_tax.Lohnsteuer2024 = engine.Lohnsteuer2025
+    monkeypatch.setitem(sys.modules, "_lohnsteuer2024", no_tax)
+    monkeypatch.setattr(germany, "LOHNSTEUER_YEARS", (2024, 2025))
+    germany._engine.cache_clear()
+    try:
+        assert germany._engine(2024) is no_tax and germany._engine(2025) is engine
+        untaxed = int(80_000 * (1 - 0.093 - 0.013 - 0.024 - 0.0855))
+        assert germany.net_salary(80_000, year=2024) == untaxed
+        assert germany.net_salary(80_000, year=2025) < untaxed
+        assert germany.net_salary_many(np.array([80_000, 80_000]), year=2024).tolist() == [untaxed] * 2
+        assert isinstance(germany._calculator(2024), engine.Lohnsteuer2025)
+    finally:
+        germany._engine.cache_clear()
+
+
+def test_unsupported_year():
+    with pytest.raises(AssertionError, match="unsupported year"):
+        germany.net_salary(80_000, year=1999)
+
+
+@pytest.mark.parametrize("stkl, pkv, krv, zkf, alter1", INPUTS[::7])
+def test_sonstige_bezuege_cents_matches_decimal_reference(stkl, pkv, krv, zkf, alter1):
+    engine = germany._engine(2025)
+    rng = np.random.default_rng(stkl * 100 + krv * 10 + alter1)
+    re4 = (SALARIES * 100).astype(np.int64)
+    sonstb = (re4 * rng.uniform(0, 1, len(re4))).astype(np.int64)
+    for wage, payment in zip(re4.tolist(), sonstb.tolist()):
+        reference = germany._calculator(2025).reset(RE4=wage, JRE4=wage, SONSTB=payment, STKL=stkl, LZZ=1, PKV=pkv, KRV=krv, ZKF=zkf, ALTER1=alter1, af=0, f=1, PVS=0, R=0, LZZHINZU=0, PVZ=0)
+        reference.MAIN()
+        expected = (int(reference.getSts()), int(reference.getSolzs()), int(reference.getBks()))
+        assert tuple(map(int, engine.sonstige_bezuege_cents(wage, payment, stkl, pkv, krv, zkf, alter1))) == expected, (wage, payment)
+    assert [tuple(map(int, values)) for values in zip(*engine.sonstige_bezuege_cents(re4, sonstb, stkl, pkv, krv, zkf, alter1))] == [tuple(map(int, engine.sonstige_bezuege_cents(wage, payment, stkl, pkv, krv, zkf, alter1))) for wage, payment in zip(re4.tolist(), sonstb.tolist())]
+
+
+def test_optimize_bonus_split_taxes_the_reported_bonus(monkeypatch):
+    salaries = np.random.default_rng(2).uniform(10_000, 300_000, 2_000).round(2)
+    engine = germany._engine(2025)
+    original, taxed = engine.sonstige_bezuege_cents, []
+    monkeypatch.setattr(engine, "sonstige_bezuege_cents", lambda re4, sonstb, *args: taxed.append(sonstb) or original(re4, sonstb, *args))
+    split = germany.optimize_bonus_split(salaries, tax_class=1)
+    (taxed_cents,) = taxed
+    assert taxed_cents.tolist() == (np.floor((salaries[:, None] * 100).astype(np.int64) * split["shares"])).astype(np.int64).tolist()
+    best = np.argmax(split["net_salary"], axis=1)
+    assert (taxed_cents[np.arange(len(salaries)), best] == np.rint(split["optimal_bonus"] * 100)).all()
+    monkeypatch.undo()
+    bonus = np.floor((salaries[:, None] * 100).astype(np.int64) * split["shares"]) / 100
+    assert split["net_salary"].tolist() == germany.net_salary_many(salaries[:, None], bonus=bonus).tolist()
+    assert split["optimal_net"].tolist() == germany.net_salary_many(salaries, bonus=split["optimal_bonus"]).tolist()
+    assert ((np.rint(split["optimal_bonus"] * 100) / 100) == split["optimal_bonus"]).all()
+    assert (split["default_net"] == germany.net_salary_many(salaries)).all()
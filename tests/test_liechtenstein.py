@@ -0,0 +1,66 @@
+import _fx
+import liechtenstein
+import numpy as np
+import pytest
+
+SALARIES = np.r_[0, 15_855, 31_755, 36_995, 36_996, 126_000, np.random.default_rng(0).uniform(0, 500_000, 2_000).round(2)]
+
+
+@pytest.fixture(autouse=True)
+def pinned_rates():
+    _fx.pin(rates={"CHF": 0.9412})
+    yield
+    _fx.pin()
+
+
+@pytest.mark.parametrize("input_currency, output_currency", [("EUR", "EUR"), ("EUR", "CHF"), ("CHF", "EUR"), ("CHF", "CHF")])
+def test_net_salary_many_matches_net_salary(input_currency, output_currency):
+    expected = [liechtenstein.net_salary(salary, input_currency, output_currency) for salary in SALARIES.tolist()]
+    assert liechtenstein.net_salary_many(SALARIES, input_currency, output_currency).tolist() == expected
+
+
+@pytest.mark.parametrize("output_currency", ["EUR", "CHF"])
+def test_net_salary_many_scalar(output_currency):
+    result = liechtenstein.net_salary_many(100_000.0, output_currency=output_currency)
+    assert np.ndim(result) == 0
+    assert result == liechtenstein.net_salary(100_000.0, output_currency=output_currency)
+
+
+@pytest.mark.parametrize("commune", ["Vaduz", "Balzers"])
+def test_net_salary_history_matches_net_salary(commune):
+    _fx.pin()
+    dates, nets = liechtenstein.net_salary_history(SALARIES, commune=commune)
+    assert nets.shape == (len(dates), len(SALARIES))
+    for row in (0, len(dates) // 2, len(dates) - 1):
+        _fx.pin(on=dates[row].item())
+        assert nets[row].tolist() == [liechtenstein.net_salary(salary, "CHF", "EUR", commune) for salary in SALARIES.tolist()]
+
+
+@pytest.mark.parametrize("commune", ["Vaduz", "Balzers"])
+def test_net_curve_matches_net_salary(commune):
+    curve = liechtenstein.net_curve(commune)
+    np.testing.assert_allclose(curve(SALARIES), [liechtenstein._net_local(salary, commune) for salary in SALARIES.tolist()], rtol=1e-12, atol=1e-8)
+    assert np.abs(curve(SALARIES) - [liechtenstein.net_salary(salary, "CHF", "CHF", commune) for salary in SALARIES.tolist()]).max() < 0.0051
+
+
+@pytest.mark.parametrize("commune", ["Vaduz", "Balzers"])
+def test_gross_for_net_inverts_net_curve(commune):
+    # the net jumps down a few CHF at the brackets, so the smallest gross reaching a net may lie below the gross it was
+    # computed from
+    curve = liechtenstein.net_curve(commune)
+    nets = curve(SALARIES)
+    gross = liechtenstein.gross_for_net(nets, "CHF", "CHF", commune)
+    assert (gross <= SALARIES + 1e-6).all() and (curve(gross) >= nets - 1e-6).all()
+    positive = gross > 0
+    assert (curve(gross[positive] - 0.01) < nets[positive]).all()
+    euros = liechtenstein.gross_for_net(_fx.convert(nets, "CHF", "EUR"), "EUR", "EUR", commune)
+    np.testing.assert_allclose(euros, _fx.convert(gross, "CHF", "EUR"), rtol=1e-12, atol=1e-8)
+
+
+def test_marginal_rate_matches_net_salary_differences():
+    step = 1.0
+    curve = liechtenstein.net_curve()
+    salaries = SALARIES[(SALARIES > 0) & (np.searchsorted(curve.ends, SALARIES) == np.searchsorted(curve.ends, SALARIES + step))]
+    differences = [(liechtenstein._net_local(salary + step, "Vaduz") - liechtenstein._net_local(salary, "Vaduz")) / step for salary in salaries.tolist()]
+    np.testing.assert_allclose(1 - liechtenstein.marginal_rate(salaries, "CHF"), differences, atol=1e-8)
+    np.testing.assert_array_equal(liechtenstein.marginal_rate(_fx.convert(salaries, "CHF", "EUR")), liechtenstein.marginal_rate(salaries, "CHF"))
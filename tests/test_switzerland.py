@@ -0,0 +1,117 @@
+import _fx
+import numpy as np
+import pytest
+import switzerland
+
+SALARIES = np.r_[0, 21_510, 148_200, np.random.default_rng(0).uniform(20_000, 400_000, 40).round(2)]
+
+
+@pytest.fixture(autouse=True)
+def pinned_rates():
+    _fx.pin(rates={"CHF": 0.9412})
+    yield
+    _fx.pin()
+
+
+@pytest.mark.parametrize("canton, commune, age, other_deductions", [("ZH", None, 30, 0.0), ("GE", None, 47, 7_000.0), ("VS", "Zermatt", 60, 0.0)])
+def test_net_salary_history_matches_net_salary(canton, commune, age, other_deductions):
+    _fx.pin()
+    dates, nets = switzerland.net_salary_history(SALARIES, canton=canton, commune=commune, age=age, other_deductions=other_deductions)
+    assert nets.shape == (len(dates), len(SALARIES))
+    for row in (0, len(dates) // 2, len(dates) - 1):
+        _fx.pin(on=dates[row].item())
+        assert nets[row].tolist() == [switzerland.net_salary(salary, canton, commune, age, "CHF", "EUR", other_deductions) for salary in SALARIES.tolist()]
+
+
+def _scalar_sweep(salaries, **kwargs):
+    cantons, communes, _ = switzerland.sweep_communes(salaries[:0])
+    return [[switzerland.net_salary(salary, canton, commune, **kwargs) for salary in salaries.tolist()] for canton, commune in zip(cantons.tolist(), communes.tolist())]
+
+
+@pytest.mark.parametrize("currencies", [("EUR", "EUR"), ("CHF", "CHF")])
+def test_sweep_communes_matches_net_salary(currencies):
+    salaries = SALARIES[:6]
+    cantons, communes, nets = switzerland.sweep_communes(salaries, age=45, input_currency=currencies[0], output_currency=currencies[1], other_deductions=3_000.0)
+    assert nets.shape == (len(communes), len(salaries)) and len(cantons) == len(communes)
+    assert nets.tolist() == _scalar_sweep(salaries, age=45, input_currency=currencies[0], output_currency=currencies[1], other_deductions=3_000.0)
+
+
+def test_best_communes_matches_net_salary():
+    salaries = SALARIES[1:4]
+    cantons, communes, _ = switzerland.sweep_communes(salaries[:0])
+    scalar = _scalar_sweep(salaries)
+    best = switzerland.best_communes(salaries, count=10)
+    assert len(best) == len(salaries)
+    for column, ranking in enumerate(best):
+        # highest net first, the csv order on ties
+        expected = sorted(range(len(communes)), key=lambda row: -scalar[row][column])[:10]
+        assert ranking == [(cantons[row], communes[row], scalar[row][column]) for row in expected]
+
+
+def test_scale_cache_info_counts_compiled_scales():
+    expected = switzerland.net_salary_many(SALARIES, canton="BE")
+    switzerland._compiled_scale.cache_clear()
+    switzerland._canton_entity.cache_clear()
+    assert switzerland.scale_cache_info()["compiled"].currsize == 0
+
+    first = [switzerland.net_salary(salary, "BE") for salary in SALARIES.tolist()]
+    info = switzerland.scale_cache_info()
+    assert set(info) == {"entity", "compiled"}
+    assert info["compiled"].misses == info["compiled"].currsize > 0 and info["entity"].misses == info["entity"].currsize > 0
+
+    second = [switzerland.net_salary(salary, "BE") for salary in SALARIES.tolist()]
+    again = switzerland.scale_cache_info()
+    assert again["compiled"].misses == info["compiled"].misses and again["compiled"].hits > info["compiled"].hits
+    assert again["entity"].misses == info["entity"].misses and again["entity"].hits > info["entity"].hits
+    assert first == second == expected.tolist()
+
+
+@pytest.mark.parametrize("currencies", [("EUR", "EUR"), ("CHF", "CHF")])
+def test_age_profile_matches_net_salary(currencies):
+    salaries = SALARIES[:12]
+    ages, nets, pension = switzerland.age_profile(salaries, range(18, 70, 3), "LU", None, *currencies, 2_000.0)
+    assert ages.tolist() == list(range(18, 70, 3)) and nets.shape == pension.shape == (len(ages), len(salaries))
+    for age, row, contributions in zip(ages.tolist(), nets.tolist(), pension.tolist()):
+        assert row == [switzerland.net_salary(salary, "LU", None, age, *currencies, 2_000.0) for salary in salaries.tolist()]
+        if currencies[1] == "CHF":
+            assert contributions == pytest.approx([switzerland._compute_social_contributions(salary, age)[3] for salary in salaries.tolist()], abs=1e-6)
+
+
+@pytest.mark.parametrize("retirement_value", [1.0, 0.8, 0.0])
+def test_optimize_deductions_matches_net_salary(retirement_value):
+    salaries = SALARIES[:8]
+    result = switzerland.optimize_deductions(salaries, "BS", None, 40, step=500.0, retirement_value=retirement_value, input_currency="CHF", output_currency="CHF")
+    deductions = result["deductions"].tolist()
+    assert deductions[0] == 0.0 and deductions[-1] == switzerland.PILLAR_3A_CAP
+    assert result["net_salary"].tolist() == [[switzerland.net_salary(salary, "BS", None, 40, "CHF", "CHF", deduction) for salary in salaries.tolist()] for deduction in deductions]
+
+    for column, salary in enumerate(salaries.tolist()):
+        values = [switzerland._net_local(salary, "BS", None, 40, deduction) - deduction * (1 - retirement_value) for deduction in deductions]
+        best = max(values)
+        assert result["optimal_value"][column] == pytest.approx(best, abs=1e-6)
+        assert result["optimal_deduction"][column] == deductions[min(row for row, value in enumerate(values) if value >= best - 1e-6)]
+
+
+def test_optimize_deductions_per_canton_matches_single_canton():
+    cantons = ["ZH", "ZG", "GE"]
+    result = switzerland.optimize_deductions(SALARIES[:5], cantons, step=1_000.0)
+    for position, canton in enumerate(cantons):
+        single = switzerland.optimize_deductions(SALARIES[:5], canton, step=1_000.0)
+        for key in ("net_salary", "marginal_saving", "optimal_deduction", "optimal_value"):
+            np.testing.assert_array_equal(result[key][position], single[key])
+
+
+@pytest.mark.parametrize("canton, commune", [("ZH", None), ("TI", "Lugano"), ("AG", None)])
+def test_net_salary_households_matches_net_salary(canton, commune):
+    households, nets = switzerland.net_salary_households(SALARIES, canton, commune, 35, "EUR", "EUR", 1_500.0)
+    assert households == tuple(switzerland.HOUSEHOLD_ENTITIES) and nets.shape == (len(households), len(SALARIES))
+    for household, row in zip(households, nets.tolist()):
+        assert row == [switzerland.net_salary(salary, canton, commune, 35, "EUR", "EUR", 1_500.0, household) for salary in SALARIES.tolist()]
+
+
+def test_net_salary_households_per_canton_matches_net_salary():
+    cantons = ["ZH", "SZ", "VD", "JU"]
+    households, nets = switzerland.net_salary_households(SALARIES, cantons, input_currency="CHF", output_currency="CHF")
+    assert nets.shape == (len(cantons), len(households), len(SALARIES))
+    for canton, matrix in zip(cantons, nets.tolist()):
+        assert matrix == [[switzerland.net_salary(salary, canton, None, 30, "CHF", "CHF", 0.0, household) for salary in SALARIES.tolist()] for household in households]
@@ -0,0 +1,43 @@
+import _fx
+import numpy as np
+import pytest
+import united_kingdom
+
+SALARIES = np.r_[0, 12_570, 50_270, 100_000, 100_001, 125_140, np.random.default_rng(0).uniform(0, 400_000, 2_000).round(2)]
+
+
+@pytest.fixture(autouse=True)
+def pinned_rates():
+    _fx.pin(rates={"GBP": 0.8437})
+    yield
+    _fx.pin()
+
+
+def test_net_salary_history_matches_net_salary():
+    _fx.pin()
+    dates, nets = united_kingdom.net_salary_history(SALARIES)
+    assert nets.shape == (len(dates), len(SALARIES))
+    for row in (0, len(dates) // 2, len(dates) - 1):
+        _fx.pin(on=dates[row].item())
+        assert nets[row].tolist() == [united_kingdom.net_salary(salary, "GBP", "EUR") for salary in SALARIES.tolist()]
+
+
+def test_net_curve_matches_net_salary():
+    # net_salary rounds tax and national insurance to whole pounds
+    assert np.abs(united_kingdom.net_curve()(SALARIES) - [united_kingdom.net_salary(salary, "GBP", "GBP") for salary in SALARIES.tolist()]).max() <= 2
+
+
+def test_gross_for_net_inverts_net_curve():
+    nets = united_kingdom.net_curve()(SALARIES)
+    np.testing.assert_allclose(united_kingdom.gross_for_net(nets, "GBP", "GBP"), SALARIES, rtol=1e-12, atol=1e-8)
+    euros = _fx.convert(nets, "GBP", "EUR")
+    np.testing.assert_allclose(united_kingdom.gross_for_net(euros, "EUR", "EUR"), _fx.convert(SALARIES, "GBP", "EUR"), rtol=1e-12, atol=1e-8)
+
+
+def test_marginal_rate_matches_net_salary_differences():
+    step = 2_000
+    curve = united_kingdom.net_curve()
+    salaries = SALARIES[(SALARIES > 0) & (np.searchsorted(curve.ends, SALARIES) == np.searchsorted(curve.ends, SALARIES + step))]
+    differences = [(united_kingdom.net_salary(salary + step, "GBP", "GBP") - united_kingdom.net_salary(salary, "GBP", "GBP")) / step for salary in salaries.tolist()]
+    np.testing.assert_allclose(1 - united_kingdom.marginal_rate(salaries, "GBP"), differences, atol=4 / step)
+    np.testing.assert_array_equal(united_kingdom.marginal_rate(_fx.convert(salaries, "GBP", "EUR")), united_kingdom.marginal_rate(salaries, "GBP"))